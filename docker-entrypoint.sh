@@ -20,6 +20,13 @@ if [ -n "${PLOSTON_LICENSE_KEY}" ]; then
     export PLOSTON_LICENSE_KEY
 fi
 
+# Graceful drain deadline on SIGTERM; together with the plugin shutdown timeout it
+# must stay below the container stop timeout (10s by default for docker stop)
+if [ -n "${PLOSTON_DRAIN_TIMEOUT}" ]; then
+    CMD_ARGS="${CMD_ARGS} --drain-timeout ${PLOSTON_DRAIN_TIMEOUT}"
+fi
+
 # Start the enterprise server
+# exec replaces the shell so the server receives SIGTERM directly and can drain
 exec ploston-enterprise-server ${CMD_ARGS}
 
@@ -0,0 +1,202 @@
+"""Enterprise REST API for Ploston Enterprise.
+
+Exposes enterprise plugin state (pattern recommendations, etc.)
+and load balancer probes alongside the core REST API.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import APIRouter, Query
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from .lifecycle import ReadinessState
+from .plugins import (
+    DiagnosticsPlugin,
+    PatternsPlugin,
+    PolicyPlugin,
+    SchedulerPlugin,
+    StepCachePlugin,
+    TelemetryPlugin,
+)
+from .policy import EvaluationRequest
+from .telemetry import Resolution
+
+# Relative to the core REST API mount point (/api/v1)
+ENTERPRISE_API_PREFIX = "/enterprise"
+PROBE_PREFIX = "/health"
+
+# Upper bound on requests per batch policy evaluation
+MAX_POLICY_BATCH = 1000
+
+
+class PolicyEvaluationItem(BaseModel):
+    """A single authorization question."""
+
+    principal: str
+    resource: str
+    action: str
+    attributes: dict[str, Any] = Field(default_factory=dict)
+
+
+class PolicyBatchRequest(BaseModel):
+    """Batch of authorization questions."""
+
+    requests: list[PolicyEvaluationItem] = Field(max_length=MAX_POLICY_BATCH)
+
+
+def create_probe_router(readiness: ReadinessState) -> APIRouter:
+    """Create the liveness and readiness probe router.
+
+    Liveness only reports that the process is serving requests.
+    Readiness returns 503 while the server is warming up or
+    draining, so load balancers hold traffic until the node is warm.
+
+    Args:
+        readiness: Server readiness state.
+
+    Returns:
+        FastAPI router to be mounted under PROBE_PREFIX.
+    """
+    router = APIRouter(tags=["Health"])
+
+    @router.get("/live")
+    async def liveness() -> dict:
+        """Report that the server process is up."""
+        return {"status": "alive", "phase": readiness.phase.value}
+
+    @router.get("/ready")
+    async def readiness_probe() -> JSONResponse:
+        """Report whether the server should receive traffic."""
+        return JSONResponse(
+            {"status": "ready" if readiness.ready else "not_ready", **readiness.to_dict()},
+            status_code=200 if readiness.ready else 503,
+        )
+
+    return router
+
+
+def create_enterprise_router(
+    patterns: Optional[PatternsPlugin] = None,
+    step_cache: Optional[StepCachePlugin] = None,
+    scheduler: Optional[SchedulerPlugin] = None,
+    telemetry: Optional[TelemetryPlugin] = None,
+    policy: Optional[PolicyPlugin] = None,
+    diagnostics: Optional[DiagnosticsPlugin] = None,
+) -> APIRouter:
+    """Create the enterprise REST API router.
+
+    Endpoints of plugins passed as None are omitted.
+
+    Args:
+        patterns: Patterns plugin instance.
+        step_cache: Step cache plugin instance.
+        scheduler: Scheduler plugin instance.
+        telemetry: Telemetry plugin instance.
+        policy: Policy plugin instance.
+        diagnostics: Diagnostics plugin instance.
+
+    Returns:
+        FastAPI router to be mounted under ENTERPRISE_API_PREFIX.
+    """
+    router = APIRouter(tags=["enterprise"])
+
+    if patterns is not None:
+
+        @router.get("/patterns/recommendations/parallel")
+        async def get_parallel_recommendations(workflow_id: Optional[str] = None) -> dict:
+            """List parallel execution recommendations."""
+            recommendations = patterns.get_parallel_recommendations(workflow_id)
+            return {"recommendations": [r.to_dict() for r in recommendations]}
+
+        @router.get("/patterns/recommendations/memoization")
+        async def get_memoization_recommendations() -> dict:
+            """List tools whose results are safe to cache."""
+            recommendations = patterns.get_memoization_recommendations()
+            return {"recommendations": [r.to_dict() for r in recommendations]}
+
+    if step_cache is not None:
+
+        @router.get("/cache/steps")
+        async def get_step_cache_stats() -> dict:
+            """Get step result cache statistics."""
+            return {
+                "tools": sorted(step_cache.cacheable_tools),
+                "stats": step_cache.cache.stats(),
+            }
+
+        @router.delete("/cache/steps")
+        async def invalidate_step_cache(tool: Optional[str] = None) -> dict:
+            """Drop cached step results."""
+            return {"invalidated": step_cache.cache.invalidate(tool)}
+
+    if scheduler is not None:
+
+        @router.get("/scheduler")
+        async def get_scheduler_stats() -> dict:
+            """Get execution slot usage and per-class queue-wait histograms."""
+            return scheduler.scheduler.stats()
+
+    if telemetry is not None:
+
+        @router.get("/telemetry/rollups")
+        async def get_telemetry_rollups(
+            resolution: Resolution = Resolution.DAILY,
+            workflow_id: Optional[str] = None,
+            since: Optional[datetime] = None,
+            until: Optional[datetime] = None,
+        ) -> dict:
+            """List execution counts, latency quantiles and error rates over time."""
+            rollups = await telemetry.store.query(resolution, workflow_id, since, until)
+            return {"rollups": [r.to_dict() for r in rollups]}
+
+        @router.get("/telemetry/storage")
+        async def get_telemetry_storage() -> dict:
+            """Get telemetry row counts per tier and retention periods."""
+            retention = telemetry.store.policy
+            return {
+                **(await telemetry.store.stats()),
+                "retention_days": {
+                    "raw": retention.raw_days,
+                    "hourly": retention.hourly_days,
+                    "daily": retention.daily_days,
+                },
+            }
+
+    if policy is not None:
+
+        @router.post("/policy/evaluate")
+        async def evaluate_policy_batch(body: PolicyBatchRequest) -> dict:
+            """Evaluate many authorization requests in one call.
+
+            Results are parallel arrays in request order: ``allowed``
+            holds the decisions and ``rules`` the deciding rule ids.
+            """
+            decisions = policy.evaluate_batch(
+                EvaluationRequest(
+                    principal=item.principal,
+                    resource=item.resource,
+                    action=item.action,
+                    attributes=item.attributes,
+                )
+                for item in body.requests
+            )
+            return {
+                "allowed": [d.allowed for d in decisions],
+                "rules": [d.rule for d in decisions],
+            }
+
+    if diagnostics is not None:
+
+        @router.get("/admin/diagnostics")
+        async def get_diagnostics() -> dict:
+            """Get event-loop lag, slow callbacks and GC pauses."""
+            return diagnostics.report()
+
+        @router.get("/admin/diagnostics/allocations")
+        async def get_allocations(top: int = Query(10, ge=1, le=100)) -> dict:
+            """Get the top live allocation sites of each plugin."""
+            return await diagnostics.sample_allocations(top)
+
+    return router
@@ -0,0 +1,8 @@
+"""Step result caching module for Ploston Enterprise."""
+
+from .result_cache import CacheEntry, StepResultCache
+
+__all__ = [
+    "CacheEntry",
+    "StepResultCache",
+]
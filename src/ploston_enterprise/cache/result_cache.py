@@ -0,0 +1,148 @@
+"""Deterministic step result cache for Ploston Enterprise."""
+
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ..patterns import canonical_digest, canonical_json
+
+
+@dataclass
+class CacheEntry:
+    """A cached tool result."""
+
+    value: Any
+    size_bytes: int
+    expires_at: float
+
+
+class StepResultCache:
+    """LRU cache of tool results keyed on canonicalized arguments.
+
+    Entries expire after ``ttl_seconds``. The cache is bounded both by
+    entry count and by the total encoded size of cached values; the least
+    recently used entries are evicted first when either bound is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(tool: str, args: dict) -> str:
+        """Build the cache key for a tool call."""
+        return f"{tool}:{canonical_digest(args)}"
+
+    def get(self, tool: str, args: dict) -> Optional[CacheEntry]:
+        """Look up a cached result.
+
+        Returns:
+            A copy of the cached entry, or None on a miss.
+        """
+        key = self.make_key(tool, args)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return CacheEntry(
+            value=copy.deepcopy(entry.value),
+            size_bytes=entry.size_bytes,
+            expires_at=entry.expires_at,
+        )
+
+    def put(self, tool: str, args: dict, value: Any) -> bool:
+        """Cache a tool result.
+
+        Returns:
+            False if the value is too large to cache, True otherwise.
+        """
+        size = len(canonical_json(value).encode())
+        if size > self._max_bytes:
+            return False
+
+        key = self.make_key(tool, args)
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = CacheEntry(
+            value=copy.deepcopy(value),
+            size_bytes=size,
+            expires_at=self._clock() + self._ttl,
+        )
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions += 1
+        return True
+
+    def invalidate(self, tool: Optional[str] = None) -> int:
+        """Drop cached results.
+
+        Args:
+            tool: Only drop results of this tool (default: drop everything).
+
+        Returns:
+            Number of entries dropped.
+        """
+        if tool is None:
+            count = len(self._entries)
+            self._entries.clear()
+            self._bytes = 0
+            return count
+
+        prefix = f"{tool}:"
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self._max_entries,
+            "max_bytes": self._max_bytes,
+            "ttl_seconds": self._ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size_bytes
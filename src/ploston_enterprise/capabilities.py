@@ -14,15 +14,35 @@ from .license import LicenseInfo
 class EnterpriseCapabilitiesProvider(CapabilitiesProvider):
     """Enterprise capabilities provider.
 
-    Returns full feature set and license info.
+    Returns full feature set and license info. Capabilities are
+    rebuilt on every call until ``prime`` is called; after that the
+    primed result is served.
     """
 
     def __init__(self, version: str, license_info: Optional[LicenseInfo] = None):
         self._license = license_info
         self._version = version
+        self._primed: Optional[Capabilities] = None
+
+    def prime(self) -> Capabilities:
+        """Build and cache capabilities.
+
+        Call once feature flags are set and all plugins are registered.
+
+        Returns:
+            The cached capabilities.
+        """
+        self._primed = self._build()
+        return self._primed
 
     def get_capabilities(self) -> Capabilities:
         """Get enterprise capabilities based on license."""
+        if self._primed is not None:
+            return self._primed
+        return self._build()
+
+    def _build(self) -> Capabilities:
+        """Build capabilities from feature flags and registered plugins."""
         flags = FeatureFlagRegistry.flags()
         plugins = PluginRegistry.get().get_enabled_features()
 
@@ -38,7 +38,7 @@ def get_enterprise_feature_flags(license_info: "LicenseInfo") -> FeatureFlags:
         max_concurrent_executions=100,
         max_workflows=None,  # Unlimited
         telemetry_retention_days=365,
-        enabled_plugins=["logging", "metrics", "policy", "patterns", "synthesis"],
+        enabled_plugins=["logging", "metrics", "policy", "patterns", "synthesis", "scheduler"],
     )
 
     return flags
@@ -60,5 +60,5 @@ ENTERPRISE_FEATURE_FLAGS = FeatureFlags(
     max_concurrent_executions=100,
     max_workflows=None,  # Unlimited
     telemetry_retention_days=365,
-    enabled_plugins=["logging", "metrics", "policy", "patterns", "synthesis"],
+    enabled_plugins=["logging", "metrics", "policy", "patterns", "synthesis", "scheduler"],
 )
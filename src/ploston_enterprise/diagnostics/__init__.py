@@ -0,0 +1,12 @@
+"""Runtime diagnostics module for Ploston Enterprise."""
+
+from .allocations import AllocationSampler
+from .gc_monitor import GCMonitor
+from .loop_lag import LoopLagMonitor, SlowCallback
+
+__all__ = [
+    "AllocationSampler",
+    "GCMonitor",
+    "LoopLagMonitor",
+    "SlowCallback",
+]
@@ -0,0 +1,47 @@
+"""Garbage collector pause tracking."""
+
+import gc
+import time
+from typing import Any, Optional
+
+
+class GCMonitor:
+    """Records garbage collection pauses per generation."""
+
+    def __init__(self):
+        self._started: Optional[float] = None
+        self._stats = {
+            gen: {"collections": 0, "collected": 0, "total_ms": 0.0, "max_ms": 0.0}
+            for gen in range(3)
+        }
+
+    def start(self) -> None:
+        """Start receiving garbage collector callbacks."""
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def stop(self) -> None:
+        """Stop receiving garbage collector callbacks."""
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def _callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+            return
+        if self._started is None:
+            return
+        pause_ms = (time.perf_counter() - self._started) * 1000
+        self._started = None
+        stats = self._stats[info["generation"]]
+        stats["collections"] += 1
+        stats["collected"] += info.get("collected", 0)
+        stats["total_ms"] += pause_ms
+        stats["max_ms"] = max(stats["max_ms"], pause_ms)
+
+    def report(self) -> dict[str, Any]:
+        """Get pause statistics per generation."""
+        return {
+            f"gen{gen}": {k: round(v, 3) if isinstance(v, float) else v for k, v in s.items()}
+            for gen, s in self._stats.items()
+        }
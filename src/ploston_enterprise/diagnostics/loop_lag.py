@@ -0,0 +1,145 @@
+"""Event-loop lag and blocking-call detection."""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlowCallback:
+    """A period during which the event loop was blocked."""
+
+    detected_at: datetime
+    blocked_ms: float
+    stack: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "detected_at": self.detected_at.isoformat(),
+            "blocked_ms": round(self.blocked_ms, 3),
+            "stack": self.stack,
+        }
+
+
+class LoopLagMonitor:
+    """Measures event-loop lag and captures the stacks of blocking calls.
+
+    A task on the loop sleeps for ``interval`` and records how late it
+    wakes up. A watchdog thread notices when that task has not run for
+    ``slow_callback_ms`` and captures the loop thread's stack while
+    the blocking call is still running, so the report points at the
+    code that blocked rather than at where a callback was scheduled.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.25,
+        slow_callback_ms: float = 100.0,
+        history: int = 1024,
+        max_slow_callbacks: int = 50,
+    ):
+        self._interval = interval
+        self._threshold = slow_callback_ms / 1000
+        self._lags: deque[float] = deque(maxlen=history)
+        self._max_lag = 0.0
+        self._slow: deque[SlowCallback] = deque(maxlen=max_slow_callbacks)
+        self._lock = threading.Lock()
+        self._beat = 0.0
+        self._reported_beat: Optional[float] = None
+        self._pending: Optional[SlowCallback] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        self._watchdog = threading.Thread(
+            target=self._watch, name="ploston-loop-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            with self._lock:
+                self._lags.append(lag)
+                self._max_lag = max(self._max_lag, lag)
+                self._beat = now
+                if self._pending is not None:
+                    # The watchdog saw the block while it was ongoing; now
+                    # that the loop is back, record how long it lasted
+                    self._pending.blocked_ms = lag * 1000
+                    self._pending = None
+
+    def _watch(self) -> None:
+        poll = max(self._threshold / 4, 0.005)
+        while not self._stop.wait(poll):
+            with self._lock:
+                beat = self._beat
+                stalled = time.monotonic() - beat - self._interval
+                if stalled < self._threshold or self._reported_beat == beat:
+                    continue
+                self._reported_beat = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            report = SlowCallback(
+                detected_at=datetime.now(UTC), blocked_ms=stalled * 1000, stack=stack
+            )
+            with self._lock:
+                self._slow.append(report)
+                if self._beat == beat:
+                    self._pending = report
+            logger.warning(
+                "Event loop blocked for at least %.0f ms:\n%s",
+                stalled * 1000,
+                "".join(stack),
+            )
+
+    def report(self) -> dict[str, Any]:
+        """Get lag statistics and recent slow callbacks."""
+        with self._lock:
+            lags = sorted(self._lags)
+            slow = [s.to_dict() for s in self._slow]
+            max_lag = self._max_lag
+        stats = {"samples": len(lags), "max_ms": round(max_lag * 1000, 3)}
+        if lags:
+            stats.update(
+                mean_ms=round(sum(lags) / len(lags) * 1000, 3),
+                p50_ms=round(lags[len(lags) // 2] * 1000, 3),
+                p99_ms=round(lags[min(len(lags) - 1, int(len(lags) * 0.99))] * 1000, 3),
+            )
+        return {
+            "interval_ms": self._interval * 1000,
+            "slow_callback_ms": self._threshold * 1000,
+            "lag": stats,
+            "slow_callbacks": slow,
+        }
@@ -0,0 +1,74 @@
+"""Workflow lifecycle hook dispatch for Ploston Enterprise.
+
+The core workflow engine does not call the extension plugin lifecycle
+hooks itself. This module wraps the engine's ``execute`` entry point
+(used by both the MCP frontend and the REST API) so that registered
+plugins see every execution.
+"""
+
+import logging
+import uuid
+from typing import Any
+
+from ploston_core.engine import WorkflowEngine
+from ploston_core.extensions import PluginRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def install_workflow_hooks(engine: WorkflowEngine, registry: PluginRegistry) -> None:
+    """Dispatch plugin workflow hooks around engine executions.
+
+    ``on_workflow_start`` runs for each plugin in registration order
+    before the workflow executes; if one raises, the execution is
+    rejected and plugins that already started receive
+    ``on_workflow_error``, as they do when the execution fails or is
+    cancelled. Completion and error hooks never fail the execution.
+
+    Each execution gets a hook context with a unique ``invocation_id``
+    that is passed to all three hooks, so plugins can correlate them.
+
+    Any further arguments (the timeout, and in newer core versions the
+    bridge session and parent execution) are passed through to the
+    engine unchanged.
+
+    Args:
+        engine: Workflow engine to instrument.
+        registry: Registry of plugins to dispatch to.
+    """
+    execute = engine.execute
+
+    async def execute_with_hooks(
+        workflow_id: str,
+        inputs: dict[str, Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        context: dict[str, Any] = {
+            "invocation_id": uuid.uuid4().hex,
+            "inputs": inputs,
+        }
+        started = []
+        try:
+            for plugin in registry.list_plugins():
+                await plugin.on_workflow_start(workflow_id, context)
+                started.append(plugin)
+            result = await execute(workflow_id, inputs, *args, **kwargs)
+        except BaseException as e:
+            # Includes cancellation (e.g. client disconnect), so plugins
+            # holding per-execution resources always release them
+            for plugin in reversed(started):
+                try:
+                    await plugin.on_workflow_error(workflow_id, e, context)
+                except Exception:
+                    logger.exception(f"Plugin {plugin.name} failed in on_workflow_error")
+            raise
+
+        for plugin in reversed(started):
+            try:
+                await plugin.on_workflow_complete(workflow_id, result, context)
+            except Exception:
+                logger.exception(f"Plugin {plugin.name} failed in on_workflow_complete")
+        return result
+
+    engine.execute = execute_with_hooks
@@ -0,0 +1,206 @@
+"""Server lifecycle management for Ploston Enterprise.
+
+This module provides:
+- Server readiness phases for load balancer probes
+- Tracking of in-flight workflow executions
+- Rejection of new executions while draining
+- Parallel plugin startup and shutdown with per-plugin timeouts
+"""
+
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ploston_core.extensions.plugins import AELPlugin
+
+
+class ServerPhase(str, Enum):
+    """Server lifecycle phase."""
+
+    STARTING = "starting"
+    WARMING = "warming"
+    READY = "ready"
+    DRAINING = "draining"
+
+
+class ReadinessState:
+    """Tracks whether the server should receive traffic.
+
+    The server is live from the moment it accepts connections, but
+    only ready once warm-up has finished and until draining starts.
+    """
+
+    def __init__(self):
+        self._phase = ServerPhase.STARTING
+        self._warm_up: dict[str, str] = {}
+
+    @property
+    def phase(self) -> ServerPhase:
+        """Current lifecycle phase."""
+        return self._phase
+
+    @property
+    def ready(self) -> bool:
+        """Whether the server should receive traffic."""
+        return self._phase == ServerPhase.READY
+
+    @property
+    def warm_up(self) -> dict[str, str]:
+        """Warm-up outcome per component."""
+        return dict(self._warm_up)
+
+    def start_warming(self) -> None:
+        """Enter the warm-up phase."""
+        self._phase = ServerPhase.WARMING
+
+    def mark_ready(self, warm_up: dict[str, str]) -> None:
+        """Finish warm-up and start receiving traffic.
+
+        Has no effect once draining has started.
+
+        Args:
+            warm_up: Warm-up outcome per component.
+        """
+        self._warm_up = dict(warm_up)
+        if self._phase != ServerPhase.DRAINING:
+            self._phase = ServerPhase.READY
+
+    def start_draining(self) -> None:
+        """Stop receiving traffic."""
+        self._phase = ServerPhase.DRAINING
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {"phase": self._phase.value, "warm_up": self.warm_up}
+
+
+class ServerDrainingError(Exception):
+    """Raised when an execution is started on a draining server."""
+
+    def __init__(self, message: str = "Server is draining", code: str = "SERVER_DRAINING"):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+class ExecutionTracker:
+    """Tracks in-flight workflow executions.
+
+    Once draining starts, new executions are rejected and
+    ``wait_idle`` resolves as soon as the last in-flight
+    execution completes.
+    """
+
+    def __init__(self):
+        self._in_flight: Counter[str] = Counter()
+        self._draining = False
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @property
+    def draining(self) -> bool:
+        """Whether the server has stopped accepting executions."""
+        return self._draining
+
+    @property
+    def in_flight(self) -> int:
+        """Number of executions currently running."""
+        return sum(self._in_flight.values())
+
+    def acquire(self, execution_id: str) -> None:
+        """Register the start of an execution.
+
+        Raises:
+            ServerDrainingError: If the server is draining.
+        """
+        if self._draining:
+            raise ServerDrainingError(
+                "Server is shutting down and not accepting new executions",
+            )
+        self._in_flight[execution_id] += 1
+        self._idle.clear()
+
+    def release(self, execution_id: str) -> None:
+        """Register the end of an execution."""
+        if self._in_flight[execution_id] <= 1:
+            self._in_flight.pop(execution_id, None)
+        else:
+            self._in_flight[execution_id] -= 1
+        if not self._in_flight:
+            self._idle.set()
+
+    def start_draining(self) -> None:
+        """Stop accepting new executions."""
+        self._draining = True
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """Wait for in-flight executions to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if all executions finished, False if the deadline passed.
+        """
+        if self._idle.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+
+async def _run_plugin_hook(
+    plugins: Iterable["AELPlugin"], hook: str, timeout: float
+) -> dict[str, str]:
+    """Run a lifecycle hook of all plugins concurrently with per-plugin timeouts."""
+    plugins = list(plugins)
+
+    async def _run(plugin: "AELPlugin") -> str:
+        try:
+            await asyncio.wait_for(getattr(plugin, hook)(), timeout=timeout)
+        except TimeoutError:
+            return "timeout"
+        except Exception as e:
+            return f"error: {e}"
+        return "ok"
+
+    outcomes = await asyncio.gather(*(_run(p) for p in plugins))
+    return {p.name: outcome for p, outcome in zip(plugins, outcomes)}
+
+
+async def startup_plugins(plugins: Iterable["AELPlugin"], timeout: float) -> dict[str, str]:
+    """Run ``on_startup`` of all plugins concurrently.
+
+    Plugins load their engines and caches in ``on_startup``; running
+    them in parallel keeps the warm-up phase as short as the slowest
+    plugin.
+
+    Args:
+        plugins: Plugins to start.
+        timeout: Per-plugin timeout in seconds.
+
+    Returns:
+        Mapping of plugin name to outcome ("ok", "timeout" or "error: ...").
+    """
+    return await _run_plugin_hook(plugins, "on_startup", timeout)
+
+
+async def shutdown_plugins(plugins: Iterable["AELPlugin"], timeout: float) -> dict[str, str]:
+    """Run ``on_shutdown`` of all plugins concurrently.
+
+    Each plugin gets its own timeout, so a slow plugin cannot delay
+    the others or hold up process exit.
+
+    Args:
+        plugins: Plugins to shut down.
+        timeout: Per-plugin timeout in seconds.
+
+    Returns:
+        Mapping of plugin name to outcome ("ok", "timeout" or "error: ...").
+    """
+    return await _run_plugin_hook(plugins, "on_shutdown", timeout)
@@ -0,0 +1,29 @@
+"""Pattern mining module for Ploston Enterprise."""
+
+from .analyzer import ParallelismAnalyzer
+from .canonical import canonical_digest, canonical_json
+from .memoization import UNMEMOIZABLE_TOOLS, MemoizationAnalyzer
+from .models import (
+    ExecutionRecord,
+    MemoizationRecommendation,
+    ParallelGroup,
+    ParallelizationRecommendation,
+    StepRecord,
+    ToolCallRecord,
+)
+from .store import ExecutionStore
+
+__all__ = [
+    "ExecutionRecord",
+    "ExecutionStore",
+    "MemoizationAnalyzer",
+    "MemoizationRecommendation",
+    "ParallelGroup",
+    "ParallelismAnalyzer",
+    "ParallelizationRecommendation",
+    "StepRecord",
+    "ToolCallRecord",
+    "UNMEMOIZABLE_TOOLS",
+    "canonical_digest",
+    "canonical_json",
+]
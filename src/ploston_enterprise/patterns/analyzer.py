@@ -0,0 +1,191 @@
+"""Parallelizable-step detection for Ploston Enterprise.
+
+Builds a data-dependency graph for each workflow from its observed
+executions and recommends running steps that never exchange data
+in parallel.
+"""
+
+import re
+from statistics import median
+from typing import Any, Optional
+
+from .canonical import canonical_json
+from .models import ExecutionRecord, ParallelGroup, ParallelizationRecommendation, StepRecord
+
+# Matches template references ({{ steps.fetch.output }}) and code step
+# lookups (steps["fetch"])
+_STEP_REFERENCE = re.compile(r"steps(?:\.([A-Za-z0-9_\-]+)|\[[\"']([^\"']+)[\"']\])")
+
+# Any use of the steps mapping in code; uses other than a literal lookup
+# (steps.get(name), steps[name], iteration) may read any earlier step
+_STEPS_NAME = re.compile(r"\bsteps\b")
+
+# Output strings shorter than this are not matched as substrings of
+# later inputs, since short values collide by accident.
+_MIN_SUBSTRING_MATCH = 8
+
+
+class ParallelismAnalyzer:
+    """Detects sequential steps that can run in parallel.
+
+    A step depends on an earlier step if it declares it in ``depends_on``,
+    references it in a template (``{{ steps.<id>.output }}``) or code
+    (``steps["<id>"]``), or received the earlier step's output as one of
+    its inputs in any observed execution. A code step that uses ``steps``
+    in any other way depends on every earlier step. Steps with no
+    dependency path between them are scheduled into the same wave; the
+    estimated saving is the difference between running all steps back
+    to back and running each wave concurrently, using the median
+    recorded duration of every step.
+    """
+
+    def __init__(self, min_executions: int = 3, min_saving_ms: float = 1.0):
+        self._min_executions = min_executions
+        self._min_saving_ms = min_saving_ms
+
+    def analyze(
+        self,
+        workflow_id: str,
+        executions: list[ExecutionRecord],
+    ) -> Optional[ParallelizationRecommendation]:
+        """Analyze executions of a workflow.
+
+        Args:
+            workflow_id: Workflow identifier.
+            executions: Observed executions, oldest first.
+
+        Returns:
+            A recommendation, or None if there is not enough history or
+            nothing worth parallelizing.
+        """
+        usable = [e for e in executions if e.succeeded and _has_unique_step_ids(e)]
+        if len(usable) < self._min_executions:
+            return None
+
+        order = [s.step_id for s in usable[-1].steps]
+        dependencies = self.dependencies(usable)
+        durations = _median_durations(usable)
+
+        waves: dict[int, list[str]] = {}
+        levels: dict[str, int] = {}
+        for step_id in order:
+            parents = [levels[d] for d in dependencies.get(step_id, ()) if d in levels]
+            level = max(parents) + 1 if parents else 0
+            levels[step_id] = level
+            waves.setdefault(level, []).append(step_id)
+
+        sequential_ms = sum(durations.get(s, 0.0) for s in order)
+        parallel_ms = 0.0
+        groups = []
+        for level in sorted(waves):
+            wave = waves[level]
+            wave_durations = [durations.get(s, 0.0) for s in wave]
+            parallel_ms += max(wave_durations)
+            if len(wave) > 1:
+                groups.append(
+                    ParallelGroup(
+                        step_ids=wave,
+                        estimated_saving_ms=sum(wave_durations) - max(wave_durations),
+                    )
+                )
+
+        recommendation = ParallelizationRecommendation(
+            workflow_id=workflow_id,
+            groups=groups,
+            sequential_ms=sequential_ms,
+            parallel_ms=parallel_ms,
+            executions_observed=len(usable),
+            dependencies={s: sorted(dependencies.get(s, ())) for s in order},
+        )
+        if not groups or recommendation.estimated_saving_ms < self._min_saving_ms:
+            return None
+        return recommendation
+
+    def dependencies(self, executions: list[ExecutionRecord]) -> dict[str, set[str]]:
+        """Build the union of data dependencies across executions.
+
+        Returns:
+            Mapping of step ID to the IDs of earlier steps it depends on.
+        """
+        graph: dict[str, set[str]] = {}
+        for execution in executions:
+            seen: list[StepRecord] = []
+            for step in execution.steps:
+                deps = graph.setdefault(step.step_id, set())
+                if seen:
+                    deps.update(_step_dependencies(step, seen))
+                seen.append(step)
+        return graph
+
+
+def _has_unique_step_ids(execution: ExecutionRecord) -> bool:
+    """Check that no step ran twice (loops are not analyzed)."""
+    ids = [s.step_id for s in execution.steps]
+    return len(ids) == len(set(ids))
+
+
+def _median_durations(executions: list[ExecutionRecord]) -> dict[str, float]:
+    """Get the median recorded duration of each step."""
+    samples: dict[str, list[float]] = {}
+    for execution in executions:
+        for step in execution.steps:
+            samples.setdefault(step.step_id, []).append(step.duration_ms)
+    return {step_id: median(values) for step_id, values in samples.items()}
+
+
+def _step_dependencies(step: StepRecord, earlier: list[StepRecord]) -> set[str]:
+    """Find which earlier steps a step consumed data from."""
+    earlier_ids = {s.step_id for s in earlier}
+    code = _step_code(step)
+    if code is not None and _reads_steps_dynamically(code, earlier_ids):
+        return earlier_ids
+
+    deps = {d for d in step.depends_on if d in earlier_ids}
+
+    fingerprints: set[str] = set()
+    strings: list[str] = []
+    _collect_inputs(step.inputs, fingerprints, strings)
+
+    for text in strings:
+        for match in _STEP_REFERENCE.finditer(text):
+            ref = match.group(1) or match.group(2)
+            if ref in earlier_ids:
+                deps.add(ref)
+
+    for prior in earlier:
+        if prior.step_id in deps or prior.output is None or isinstance(prior.output, bool):
+            continue
+        if canonical_json(prior.output) in fingerprints:
+            deps.add(prior.step_id)
+        elif isinstance(prior.output, str) and len(prior.output) >= _MIN_SUBSTRING_MATCH:
+            if any(prior.output in text for text in strings):
+                deps.add(prior.step_id)
+
+    return deps
+
+
+def _step_code(step: StepRecord) -> Optional[str]:
+    """Get the source of a code step, or None for other steps."""
+    if step.tool not in (None, "python_exec"):
+        return None
+    code = step.inputs.get("code")
+    return code if isinstance(code, str) else None
+
+
+def _reads_steps_dynamically(code: str, earlier_ids: set[str]) -> bool:
+    """Check if code uses steps other than by literal lookup of an earlier step."""
+    literal = {m.start(): m.group(1) or m.group(2) for m in _STEP_REFERENCE.finditer(code)}
+    return any(literal.get(m.start()) not in earlier_ids for m in _STEPS_NAME.finditer(code))
+
+
+def _collect_inputs(value: Any, fingerprints: set[str], strings: list[str]) -> None:
+    """Collect fingerprints of every input subtree and all input strings."""
+    if isinstance(value, dict):
+        for item in value.values():
+            _collect_inputs(item, fingerprints, strings)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _collect_inputs(item, fingerprints, strings)
+    elif isinstance(value, str):
+        strings.append(value)
+    fingerprints.add(canonical_json(value))
@@ -0,0 +1,24 @@
+"""Canonical value encoding for pattern mining."""
+
+import hashlib
+import json
+from typing import Any
+
+
+def canonical_json(value: Any) -> str:
+    """Encode a value as canonical JSON.
+
+    Dict keys are sorted and whitespace is stripped, so equal values
+    always produce the same string. Values that are not JSON-serializable
+    fall back to their ``repr``.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=repr)
+
+
+def canonical_digest(value: Any) -> str:
+    """Hash a value's canonical JSON encoding.
+
+    Equal values always produce the same digest, so observations can
+    be compared without keeping the values themselves.
+    """
+    return hashlib.sha256(canonical_json(value).encode()).hexdigest()
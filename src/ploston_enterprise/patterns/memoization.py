@@ -0,0 +1,93 @@
+"""Memoizable-tool detection for Ploston Enterprise.
+
+Finds tools whose output has been a pure function of their inputs
+across all observed invocations.
+"""
+
+from statistics import median
+from typing import Optional
+
+from .models import MemoizationRecommendation, ToolCallRecord
+
+# Tools never recommended for memoization. Code steps run through
+# python_exec and may call side-effecting tools, so a constant result
+# does not make them safe to skip.
+UNMEMOIZABLE_TOOLS = frozenset({"python_exec"})
+
+
+class MemoizationAnalyzer:
+    """Detects tools that are safe to memoize.
+
+    A tool is considered pure if every observed call with the same
+    canonicalized arguments returned the same output, compared by
+    digest. A tool is only recommended once it has been called
+    repeatedly with identical arguments, since determinism cannot be
+    observed otherwise. A tool with side effects can look pure too
+    (e.g. one that always returns an acknowledgement), so
+    recommendations are advisory. The estimated saving is the recorded
+    time spent on calls that a cache would have served.
+    """
+
+    def __init__(self, min_observations: int = 3, min_repeated_calls: int = 1):
+        self._min_observations = min_observations
+        self._min_repeated_calls = min_repeated_calls
+
+    def analyze(
+        self,
+        tool_calls: dict[str, list[ToolCallRecord]],
+    ) -> list[MemoizationRecommendation]:
+        """Analyze observed tool calls.
+
+        Args:
+            tool_calls: Observed successful calls keyed by tool name.
+
+        Returns:
+            Recommendations ordered by estimated saving, largest first.
+        """
+        recommendations = []
+        for tool, calls in tool_calls.items():
+            if tool in UNMEMOIZABLE_TOOLS:
+                continue
+            recommendation = self._analyze_tool(tool, calls)
+            if recommendation is not None:
+                recommendations.append(recommendation)
+
+        recommendations.sort(key=lambda r: r.estimated_saving_ms, reverse=True)
+        return recommendations
+
+    def _analyze_tool(
+        self,
+        tool: str,
+        calls: list[ToolCallRecord],
+    ) -> Optional[MemoizationRecommendation]:
+        """Analyze the calls of a single tool."""
+        if len(calls) < self._min_observations:
+            return None
+
+        # args digest -> (output digest, durations)
+        by_args: dict[str, tuple[str, list[float]]] = {}
+        for call in calls:
+            observed = by_args.get(call.args_digest)
+            if observed is None:
+                by_args[call.args_digest] = (call.output_digest, [call.duration_ms])
+            elif observed[0] != call.output_digest:
+                return None
+            else:
+                observed[1].append(call.duration_ms)
+
+        repeated = len(calls) - len(by_args)
+        if repeated < self._min_repeated_calls:
+            return None
+
+        saving = sum(
+            (len(durations) - 1) * median(durations)
+            for _, durations in by_args.values()
+            if len(durations) > 1
+        )
+        return MemoizationRecommendation(
+            tool=tool,
+            observations=len(calls),
+            distinct_arguments=len(by_args),
+            repeated_calls=repeated,
+            estimated_saving_ms=saving,
+        )
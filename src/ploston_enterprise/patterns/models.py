@@ -0,0 +1,153 @@
+"""Pattern mining models for Ploston Enterprise."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class StepRecord:
+    """A single observed step execution."""
+
+    step_id: str
+    tool: Optional[str]
+    inputs: dict[str, Any]
+    output: Any
+    duration_ms: float
+    status: str = "completed"
+    depends_on: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Optional["StepRecord"]:
+        """Build a step record from a workflow result step entry.
+
+        Returns None if the entry has no step identifier.
+        """
+        step_id = data.get("id") or data.get("step_id")
+        if not step_id:
+            return None
+
+        inputs = data.get("inputs")
+        if inputs is None:
+            inputs = data.get("params") or {}
+
+        try:
+            duration_ms = float(data.get("duration_ms") or 0.0)
+        except (TypeError, ValueError):
+            duration_ms = 0.0
+
+        depends_on = data.get("depends_on") or []
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+
+        return cls(
+            step_id=str(step_id),
+            tool=data.get("tool"),
+            inputs=inputs if isinstance(inputs, dict) else {"value": inputs},
+            output=data.get("output"),
+            duration_ms=duration_ms,
+            status=str(data.get("status") or "completed"),
+            depends_on=[str(d) for d in depends_on],
+        )
+
+
+@dataclass
+class ToolCallRecord:
+    """A single observed tool invocation.
+
+    Arguments and output are kept as digests of their canonical JSON
+    encoding rather than as the (possibly large) values themselves.
+    """
+
+    tool: str
+    args_digest: str
+    output_digest: str
+    duration_ms: float
+
+
+@dataclass
+class ExecutionRecord:
+    """An observed workflow execution."""
+
+    workflow_id: str
+    steps: list[StepRecord]
+    status: str = "completed"
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the execution and all of its steps completed."""
+        return self.status == "completed" and all(s.status == "completed" for s in self.steps)
+
+
+@dataclass
+class ParallelGroup:
+    """A set of steps that can run concurrently."""
+
+    step_ids: list[str]
+    estimated_saving_ms: float
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "step_ids": self.step_ids,
+            "estimated_saving_ms": round(self.estimated_saving_ms, 3),
+        }
+
+
+@dataclass
+class ParallelizationRecommendation:
+    """Recommendation to run independent workflow steps in parallel."""
+
+    workflow_id: str
+    groups: list[ParallelGroup]
+    sequential_ms: float
+    parallel_ms: float
+    executions_observed: int
+    dependencies: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def estimated_saving_ms(self) -> float:
+        """Estimated latency saved per execution."""
+        return max(0.0, self.sequential_ms - self.parallel_ms)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "workflow_id": self.workflow_id,
+            "type": "parallel_execution",
+            "groups": [g.to_dict() for g in self.groups],
+            "sequential_ms": round(self.sequential_ms, 3),
+            "parallel_ms": round(self.parallel_ms, 3),
+            "estimated_saving_ms": round(self.estimated_saving_ms, 3),
+            "executions_observed": self.executions_observed,
+            "dependencies": self.dependencies,
+        }
+
+
+@dataclass
+class MemoizationRecommendation:
+    """Recommendation to cache results of a deterministic tool."""
+
+    tool: str
+    observations: int
+    distinct_arguments: int
+    repeated_calls: int
+    estimated_saving_ms: float
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of observed calls a cache would have served."""
+        if not self.observations:
+            return 0.0
+        return self.repeated_calls / self.observations
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "tool": self.tool,
+            "type": "memoization",
+            "observations": self.observations,
+            "distinct_arguments": self.distinct_arguments,
+            "repeated_calls": self.repeated_calls,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "estimated_saving_ms": round(self.estimated_saving_ms, 3),
+        }
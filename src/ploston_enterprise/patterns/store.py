@@ -0,0 +1,109 @@
+"""In-memory execution history for pattern mining."""
+
+from collections import deque
+from typing import Any, Optional
+
+from .canonical import canonical_digest
+from .models import ExecutionRecord, StepRecord, ToolCallRecord
+
+
+class ExecutionStore:
+    """Bounded history of observed executions and tool calls.
+
+    Only the most recent executions of each workflow and the most recent
+    calls of each tool are kept, so memory stays proportional to the
+    number of distinct workflows and tools.
+    """
+
+    def __init__(
+        self,
+        max_executions_per_workflow: int = 100,
+        max_calls_per_tool: int = 1000,
+    ):
+        self._max_executions = max_executions_per_workflow
+        self._max_calls = max_calls_per_tool
+        self._executions: dict[str, deque[ExecutionRecord]] = {}
+        self._tool_calls: dict[str, deque[ToolCallRecord]] = {}
+
+    def record(self, workflow_id: str, result: dict) -> Optional[ExecutionRecord]:
+        """Record a workflow result.
+
+        Args:
+            workflow_id: Workflow identifier.
+            result: Workflow result as passed to ``on_workflow_complete``.
+
+        Returns:
+            The recorded execution, or None if the result had no steps.
+        """
+        steps = []
+        for entry in result.get("steps") or []:
+            if not isinstance(entry, dict):
+                continue
+            step = StepRecord.from_dict(entry)
+            if step is not None:
+                steps.append(step)
+
+        if not steps:
+            return None
+
+        execution = ExecutionRecord(
+            workflow_id=workflow_id,
+            steps=steps,
+            status=str(result.get("status") or "completed"),
+        )
+        history = self._executions.get(workflow_id)
+        if history is None:
+            history = deque(maxlen=self._max_executions)
+            self._executions[workflow_id] = history
+        history.append(execution)
+        return execution
+
+    def record_tool_call(
+        self,
+        tool: str,
+        args: dict[str, Any],
+        output: Any,
+        duration_ms: float,
+    ) -> ToolCallRecord:
+        """Record a successful tool invocation.
+
+        Only digests of the arguments and output are kept.
+
+        Args:
+            tool: Tool name.
+            args: Rendered arguments the tool was called with.
+            output: Tool output.
+            duration_ms: Invocation time in milliseconds.
+
+        Returns:
+            The recorded call.
+        """
+        call = ToolCallRecord(
+            tool=tool,
+            args_digest=canonical_digest(args),
+            output_digest=canonical_digest(output),
+            duration_ms=duration_ms,
+        )
+        history = self._tool_calls.get(tool)
+        if history is None:
+            history = deque(maxlen=self._max_calls)
+            self._tool_calls[tool] = history
+        history.append(call)
+        return call
+
+    def tool_calls(self) -> dict[str, list[ToolCallRecord]]:
+        """Get recorded calls of every tool, keyed by tool name."""
+        return {tool: list(history) for tool, history in self._tool_calls.items()}
+
+    def executions(self, workflow_id: str) -> list[ExecutionRecord]:
+        """Get recorded executions for a workflow, oldest first."""
+        return list(self._executions.get(workflow_id, ()))
+
+    def workflow_ids(self) -> list[str]:
+        """Get identifiers of all workflows with recorded executions."""
+        return list(self._executions)
+
+    def clear(self) -> None:
+        """Drop all recorded executions and tool calls."""
+        self._executions.clear()
+        self._tool_calls.clear()
@@ -1,11 +1,21 @@
 """Enterprise plugins for Ploston Enterprise."""
 
+from .diagnostics import DiagnosticsPlugin
+from .drain import DrainPlugin
 from .patterns import PatternsPlugin
 from .policy import PolicyPlugin
+from .scheduler import SchedulerPlugin
+from .step_cache import StepCachePlugin
 from .synthesis import SynthesisPlugin
+from .telemetry import TelemetryPlugin
 
 __all__ = [
     "PolicyPlugin",
     "PatternsPlugin",
     "SynthesisPlugin",
+    "StepCachePlugin",
+    "DrainPlugin",
+    "SchedulerPlugin",
+    "TelemetryPlugin",
+    "DiagnosticsPlugin",
 ]
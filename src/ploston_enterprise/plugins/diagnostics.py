@@ -0,0 +1,76 @@
+"""Diagnostics plugin for profiling enterprise deployments.
+
+Opt-in: when the plugin is not registered, none of its monitors run
+and tracemalloc stays off.
+"""
+
+import asyncio
+import inspect
+from typing import Any
+
+from ploston_core.extensions import PluginRegistry
+from ploston_core.extensions.plugins import AELPlugin
+
+from ..diagnostics import AllocationSampler, GCMonitor, LoopLagMonitor
+
+
+class DiagnosticsPlugin(AELPlugin):
+    """Enterprise diagnostics plugin.
+
+    This plugin provides:
+    - Event-loop lag measurement
+    - Slow callback detection with the blocking stack
+    - Garbage collection pause tracking
+    - Per-plugin allocation sampling with tracemalloc
+    """
+
+    name = "diagnostics"
+    tier = "enterprise"
+    version = "1.0.0"
+
+    def __init__(
+        self,
+        slow_callback_ms: float = 100.0,
+        lag_interval_seconds: float = 0.25,
+        tracemalloc_frames: int = 16,
+    ):
+        super().__init__()
+        self._loop_lag = LoopLagMonitor(
+            interval=lag_interval_seconds, slow_callback_ms=slow_callback_ms
+        )
+        self._gc = GCMonitor()
+        self._allocations = AllocationSampler(frames=tracemalloc_frames)
+
+    async def on_startup(self) -> None:
+        """Start all monitors."""
+        self._allocations.start()
+        self._gc.start()
+        self._loop_lag.start()
+
+    async def on_shutdown(self) -> None:
+        """Stop all monitors."""
+        await self._loop_lag.stop()
+        self._gc.stop()
+        self._allocations.stop()
+
+    def report(self) -> dict[str, Any]:
+        """Get event-loop lag, slow callbacks and GC pauses."""
+        return {
+            "event_loop": self._loop_lag.report(),
+            "gc": self._gc.report(),
+            "tracemalloc": self._allocations.tracing,
+        }
+
+    async def sample_allocations(self, top: int = 10) -> dict[str, Any]:
+        """Get the top allocation sites of each registered plugin.
+
+        The snapshot is analyzed off the event loop.
+
+        Args:
+            top: Number of allocation sites to report per plugin.
+        """
+        modules = {
+            plugin.name: inspect.getfile(type(plugin))
+            for plugin in PluginRegistry.get().list_plugins()
+        }
+        return await asyncio.to_thread(self._allocations.sample, modules, top)
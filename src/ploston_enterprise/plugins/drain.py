@@ -0,0 +1,49 @@
+"""Drain plugin for graceful shutdown.
+
+Tracks in-flight workflow executions so the server can finish them
+before exiting, and rejects new executions once draining has started.
+"""
+
+from typing import Any, Optional
+
+from ploston_core.extensions.plugins import AELPlugin
+
+from ..lifecycle import ExecutionTracker
+
+
+class DrainPlugin(AELPlugin):
+    """Enterprise drain plugin for graceful shutdown.
+
+    This plugin provides:
+    - In-flight execution tracking
+    - Rejection of new executions while draining
+    """
+
+    name = "drain"
+    tier = "enterprise"
+    version = "1.0.0"
+
+    def __init__(self, tracker: Optional[ExecutionTracker] = None):
+        super().__init__()
+        self._tracker = tracker or ExecutionTracker()
+
+    @property
+    def tracker(self) -> ExecutionTracker:
+        """In-flight execution tracker."""
+        return self._tracker
+
+    async def on_workflow_start(self, workflow_id: str, context: dict[str, Any]) -> None:
+        """Register the execution, or reject it if the server is draining."""
+        self._tracker.acquire(context["invocation_id"])
+
+    async def on_workflow_complete(
+        self, workflow_id: str, result: Any, context: dict[str, Any]
+    ) -> None:
+        """Mark the execution as finished."""
+        self._tracker.release(context["invocation_id"])
+
+    async def on_workflow_error(
+        self, workflow_id: str, error: Exception, context: dict[str, Any]
+    ) -> None:
+        """Mark the failed execution as finished."""
+        self._tracker.release(context["invocation_id"])
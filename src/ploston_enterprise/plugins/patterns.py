@@ -1,9 +1,23 @@
 """Patterns plugin for workflow pattern mining.
 
-This is a stub implementation for the enterprise patterns plugin.
+Records observed workflow executions and derives optimization
+recommendations from them.
 """
 
+from typing import Any, Optional
+
 from ploston_core.extensions.plugins import AELPlugin
+from ploston_core.invoker import ToolCallResult, ToolInvoker
+from ploston_core.workflow import WorkflowRegistry
+
+from ..patterns import (
+    UNMEMOIZABLE_TOOLS,
+    ExecutionStore,
+    MemoizationAnalyzer,
+    MemoizationRecommendation,
+    ParallelismAnalyzer,
+    ParallelizationRecommendation,
+)
 
 
 class PatternsPlugin(AELPlugin):
@@ -16,19 +30,128 @@ class PatternsPlugin(AELPlugin):
     """
 
     name = "patterns"
+    tier = "enterprise"
     version = "1.0.0"
 
+    def __init__(
+        self,
+        max_executions_per_workflow: int = 100,
+        min_executions: int = 3,
+        workflow_registry: Optional[WorkflowRegistry] = None,
+    ):
+        super().__init__()
+        self._workflow_registry = workflow_registry
+        self._store = ExecutionStore(max_executions_per_workflow=max_executions_per_workflow)
+        self._parallelism = ParallelismAnalyzer(min_executions=min_executions)
+        self._memoization = MemoizationAnalyzer(min_observations=min_executions)
+
+    @property
+    def store(self) -> ExecutionStore:
+        """Execution history observed by this plugin."""
+        return self._store
+
     async def on_startup(self) -> None:
         """Initialize pattern mining engine on server startup."""
-        # TODO: Initialize pattern mining engine
         pass
 
     async def on_shutdown(self) -> None:
         """Cleanup pattern mining engine on server shutdown."""
-        # TODO: Cleanup pattern mining engine
-        pass
+        self._store.clear()
 
-    async def on_workflow_complete(self, workflow_id: str, result: dict) -> None:
-        """Analyze workflow execution for patterns."""
-        # TODO: Implement pattern analysis
-        pass
+    async def on_workflow_complete(
+        self, workflow_id: str, result: Any, context: dict[str, Any]
+    ) -> None:
+        """Record the workflow execution for pattern analysis."""
+        data = result.to_dict() if hasattr(result, "to_dict") else result
+        if not isinstance(data, dict):
+            return
+
+        # Execution results only carry step outputs; take tools, parameter
+        # templates and declared dependencies from the workflow definition
+        definitions = self._step_definitions(workflow_id)
+        if definitions:
+            steps = []
+            for step in data.get("steps") or []:
+                step_id = step.get("step_id") or step.get("id")
+                steps.append({**definitions.get(step_id, {}), **step})
+            data = {**data, "steps": steps}
+
+        self._store.record(workflow_id, data)
+
+    def get_parallel_recommendations(
+        self,
+        workflow_id: Optional[str] = None,
+    ) -> list[ParallelizationRecommendation]:
+        """Get parallel execution recommendations.
+
+        Args:
+            workflow_id: Restrict to a single workflow (default: all workflows).
+
+        Returns:
+            Recommendations ordered by estimated saving, largest first.
+        """
+        workflow_ids = [workflow_id] if workflow_id else self._store.workflow_ids()
+        recommendations = []
+        for wf_id in workflow_ids:
+            recommendation = self._parallelism.analyze(wf_id, self._store.executions(wf_id))
+            if recommendation is not None:
+                recommendations.append(recommendation)
+        recommendations.sort(key=lambda r: r.estimated_saving_ms, reverse=True)
+        return recommendations
+
+    def get_memoization_recommendations(self) -> list[MemoizationRecommendation]:
+        """Get recommendations for tools whose results are safe to cache.
+
+        Returns:
+            Recommendations ordered by estimated saving, largest first.
+        """
+        return self._memoization.analyze(self._store.tool_calls())
+
+    def observe_tool_calls(self, invoker: ToolInvoker) -> None:
+        """Record successful tool invocations for memoization analysis.
+
+        Wraps ``invoker.invoke``, which receives the rendered arguments
+        of every tool step and nested tool call. Calls of tools that are
+        never memoized (code steps, whose arguments carry the whole
+        sandbox context) are not recorded.
+
+        Args:
+            invoker: Tool invoker shared with the workflow engine.
+        """
+        invoke = invoker.invoke
+
+        async def observed_invoke(
+            tool_name: str,
+            params: dict[str, Any],
+            timeout_seconds: Optional[int] = None,
+            step_id: Optional[str] = None,
+            execution_id: Optional[str] = None,
+        ) -> ToolCallResult:
+            result = await invoke(
+                tool_name,
+                params,
+                timeout_seconds=timeout_seconds,
+                step_id=step_id,
+                execution_id=execution_id,
+            )
+            if result.success and tool_name not in UNMEMOIZABLE_TOOLS:
+                self._store.record_tool_call(tool_name, params, result.output, result.duration_ms)
+            return result
+
+        invoker.invoke = observed_invoke
+
+    def _step_definitions(self, workflow_id: str) -> dict[str, dict]:
+        """Get step tools, parameters and dependencies from the workflow definition."""
+        if self._workflow_registry is None:
+            return {}
+        workflow = self._workflow_registry.get(workflow_id)
+        if workflow is None:
+            return {}
+        return {
+            step.id: {
+                "tool": step.tool,
+                "inputs": step.params if step.tool else {"code": step.code},
+                "depends_on": step.depends_on or [],
+            }
+            for step in workflow.steps
+        }
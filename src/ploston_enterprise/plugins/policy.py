@@ -1,10 +1,15 @@
-"""Policy plugin for RBAC/ABAC access control.
+"""Policy plugin for RBAC/ABAC access control."""
 
-This is a stub implementation for the enterprise policy plugin.
-"""
+from collections.abc import Iterable
+from typing import Any, Optional
 
 from ploston_core.extensions.plugins import AELPlugin
 
+from ..policy import Decision, EvaluationRequest, PolicyEngine, PolicyError
+
+# Action checked before a workflow executes
+EXECUTE_WORKFLOW_ACTION = "workflow:execute"
+
 
 class PolicyPlugin(AELPlugin):
     """Enterprise policy plugin for RBAC/ABAC access control.
@@ -13,27 +18,59 @@ class PolicyPlugin(AELPlugin):
     - Role-based access control (RBAC)
     - Attribute-based access control (ABAC)
     - Policy enforcement for workflow execution
+    - Batch evaluation for planners authorizing many steps at once
+
+    Executions are checked when the hook context carries a
+    ``principal``, which a plugin registered earlier can set.
     """
 
     name = "policy"
+    tier = "enterprise"
     version = "1.0.0"
 
+    def __init__(self, engine: Optional[PolicyEngine] = None):
+        super().__init__()
+        self._engine = engine or PolicyEngine()
+
+    @property
+    def engine(self) -> PolicyEngine:
+        """Underlying policy engine."""
+        return self._engine
+
     async def on_startup(self) -> None:
-        """Initialize policy engine on server startup."""
-        # TODO: Initialize policy engine
-        pass
-
-    async def on_shutdown(self) -> None:
-        """Cleanup policy engine on server shutdown."""
-        # TODO: Cleanup policy engine
-        pass
-
-    async def on_workflow_start(self, workflow_id: str, context: dict) -> None:
-        """Check policy before workflow execution."""
-        # TODO: Implement policy check
-        pass
-
-    async def on_workflow_complete(self, workflow_id: str, result: dict) -> None:
-        """Log policy audit after workflow completion."""
-        # TODO: Implement audit logging
-        pass
+        """Compile policies on server startup."""
+        self._engine.compile()
+
+    async def on_workflow_start(self, workflow_id: str, context: dict[str, Any]) -> None:
+        """Check policy before workflow execution.
+
+        Raises:
+            PolicyError: If the principal may not execute the workflow.
+        """
+        principal = context.get("principal")
+        if principal is None:
+            return
+        decision = self._engine.evaluate(
+            EvaluationRequest(
+                principal=principal,
+                resource=f"workflow:{workflow_id}",
+                action=EXECUTE_WORKFLOW_ACTION,
+                attributes=context.get("attributes", {}),
+            )
+        )
+        if not decision.allowed:
+            raise PolicyError(
+                f"Principal {principal!r} may not execute workflow {workflow_id!r}",
+                code="POLICY_DENIED",
+            )
+
+    def evaluate_batch(self, requests: Iterable[EvaluationRequest]) -> list[Decision]:
+        """Evaluate many authorization requests in one pass.
+
+        Args:
+            requests: Requests to evaluate.
+
+        Returns:
+            Decisions in request order.
+        """
+        return self._engine.evaluate_batch(requests)
@@ -0,0 +1,71 @@
+"""Scheduler plugin for priority-aware execution admission.
+
+Holds each workflow execution in ``on_workflow_start`` until the
+weighted fair scheduler grants it a slot.
+"""
+
+from typing import Any, Optional
+
+from ploston_core.extensions.plugins import AELPlugin
+
+from ..scheduling import WeightedFairScheduler, current_seat
+
+
+class SchedulerPlugin(AELPlugin):
+    """Enterprise scheduler plugin.
+
+    This plugin provides:
+    - Concurrency limiting across all workflow executions
+    - Weighted fair queuing across priority classes and license seats
+    - Per-class queue-wait histograms
+
+    The priority class is taken from the hook context (``priority``),
+    then from the configured workflow mapping, and otherwise is the
+    scheduler's default (lowest-weight) class. The seat is taken from
+    the hook context (``seat``), then from the caller of the HTTP
+    request that started the execution.
+    """
+
+    name = "scheduler"
+    tier = "enterprise"
+    version = "1.0.0"
+
+    def __init__(
+        self,
+        scheduler: WeightedFairScheduler,
+        workflow_classes: Optional[dict[str, str]] = None,
+    ):
+        super().__init__()
+        self._scheduler = scheduler
+        self._workflow_classes = dict(workflow_classes or {})
+        self._slots: dict[str, str] = {}
+
+    @property
+    def scheduler(self) -> WeightedFairScheduler:
+        """Underlying scheduler."""
+        return self._scheduler
+
+    async def on_workflow_start(self, workflow_id: str, context: dict[str, Any]) -> None:
+        """Wait for an execution slot."""
+        requested = context.get("priority") or self._workflow_classes.get(workflow_id)
+        seat = context.get("seat") or current_seat() or "default"
+        granted = await self._scheduler.acquire(requested, seat=seat)
+        self._slots[context["invocation_id"]] = granted
+        context["priority"] = granted
+
+    async def on_workflow_complete(
+        self, workflow_id: str, result: Any, context: dict[str, Any]
+    ) -> None:
+        """Free the execution slot."""
+        self._release(context)
+
+    async def on_workflow_error(
+        self, workflow_id: str, error: Exception, context: dict[str, Any]
+    ) -> None:
+        """Free the execution slot of a failed execution."""
+        self._release(context)
+
+    def _release(self, context: dict[str, Any]) -> None:
+        granted = self._slots.pop(context["invocation_id"], None)
+        if granted is not None:
+            self._scheduler.release(granted)
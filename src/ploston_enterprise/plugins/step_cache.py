@@ -0,0 +1,104 @@
+"""Step cache plugin for deterministic tool results.
+
+Serves repeated tool calls with identical arguments from a cache
+instead of invoking the tool again. Opt-in: the plugin only caches
+tools that an operator explicitly allow-listed. Tools the patterns
+plugin observed to be deterministic are recommendations only, since
+a tool with side effects can look deterministic too.
+"""
+
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from ploston_core.extensions.plugins import AELPlugin
+from ploston_core.invoker import ToolCallResult, ToolInvoker
+
+from ..cache import StepResultCache
+from ..patterns import UNMEMOIZABLE_TOOLS
+
+
+class StepCachePlugin(AELPlugin):
+    """Enterprise step cache plugin.
+
+    This plugin provides:
+    - Result caching for deterministic tool steps
+    - TTL/LRU eviction with size accounting
+
+    ``python_exec`` is never cached, even when allow-listed, since
+    skipping a code step also skips the tool calls it makes.
+    """
+
+    name = "step_cache"
+    tier = "enterprise"
+    version = "1.0.0"
+
+    def __init__(
+        self,
+        cache: Optional[StepResultCache] = None,
+        tools: Optional[Iterable[str]] = None,
+    ):
+        super().__init__()
+        self._cache = cache or StepResultCache()
+        self._tools = set(tools or ()) - UNMEMOIZABLE_TOOLS
+
+    @property
+    def cache(self) -> StepResultCache:
+        """Underlying result cache."""
+        return self._cache
+
+    @property
+    def cacheable_tools(self) -> set[str]:
+        """Allow-listed tools whose results are cached."""
+        return set(self._tools)
+
+    async def on_shutdown(self) -> None:
+        """Drop all cached results on server shutdown."""
+        self._cache.invalidate()
+
+    def attach(self, invoker: ToolInvoker) -> None:
+        """Serve cacheable tool calls from the cache.
+
+        Wraps ``invoker.invoke``; the workflow engine and code steps call
+        tools through the same invoker instance. Only successful results
+        are cached.
+
+        Args:
+            invoker: Tool invoker shared with the workflow engine.
+        """
+        invoke = invoker.invoke
+
+        async def cached_invoke(
+            tool_name: str,
+            params: dict[str, Any],
+            timeout_seconds: Optional[int] = None,
+            step_id: Optional[str] = None,
+            execution_id: Optional[str] = None,
+        ) -> ToolCallResult:
+            cacheable = tool_name in self._tools
+            if cacheable:
+                entry = self._cache.get(tool_name, params)
+                if entry is not None:
+                    return ToolCallResult(
+                        success=True,
+                        output=entry.value["output"],
+                        duration_ms=0,
+                        tool_name=tool_name,
+                        structured_content=entry.value["structured_content"],
+                    )
+
+            result = await invoke(
+                tool_name,
+                params,
+                timeout_seconds=timeout_seconds,
+                step_id=step_id,
+                execution_id=execution_id,
+            )
+            if cacheable and result.success:
+                self._cache.put(
+                    tool_name,
+                    params,
+                    {"output": result.output, "structured_content": result.structured_content},
+                )
+            return result
+
+        invoker.invoke = cached_invoke
@@ -16,6 +16,7 @@ class SynthesisPlugin(AELPlugin):
     """
 
     name = "synthesis"
+    tier = "enterprise"
     version = "1.0.0"
 
     async def on_startup(self) -> None:
@@ -0,0 +1,112 @@
+"""Telemetry plugin with tiered retention.
+
+Records one raw telemetry sample per workflow execution and compacts
+the store in the background.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, datetime
+from typing import Any, Optional
+
+from ploston_core.extensions.plugins import AELPlugin
+
+from ..telemetry import ExecutionSample, TieredTelemetryStore
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetryPlugin(AELPlugin):
+    """Enterprise telemetry retention plugin.
+
+    This plugin provides:
+    - Raw per-execution telemetry (duration, outcome)
+    - Hourly and daily rollups with quantile sketches and error rates
+    - Background compaction bounded by the retention policy
+    """
+
+    name = "telemetry"
+    tier = "enterprise"
+    version = "1.0.0"
+
+    def __init__(
+        self,
+        store: Optional[TieredTelemetryStore] = None,
+        compaction_interval_seconds: float = 300.0,
+    ):
+        super().__init__()
+        self._store = store or TieredTelemetryStore()
+        self._interval = compaction_interval_seconds
+        self._started: dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def store(self) -> TieredTelemetryStore:
+        """Underlying telemetry store."""
+        return self._store
+
+    async def on_startup(self) -> None:
+        """Compact once, then keep compacting in the background."""
+        await self._store.compact()
+        self._task = asyncio.create_task(self._compaction_loop())
+
+    async def on_shutdown(self) -> None:
+        """Stop compaction and close the store."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._store.close()
+
+    async def on_workflow_start(self, workflow_id: str, context: dict[str, Any]) -> None:
+        """Note the start time of the execution."""
+        self._started[context["invocation_id"]] = time.monotonic()
+
+    async def on_workflow_complete(
+        self, workflow_id: str, result: Any, context: dict[str, Any]
+    ) -> None:
+        """Record the execution outcome."""
+        data = result.to_dict() if hasattr(result, "to_dict") else result
+        data = data if isinstance(data, dict) else {}
+        await self._record(
+            workflow_id,
+            context,
+            success=data.get("status") == "completed",
+            duration_ms=data.get("duration_ms"),
+        )
+
+    async def on_workflow_error(
+        self, workflow_id: str, error: Exception, context: dict[str, Any]
+    ) -> None:
+        """Record the failed execution."""
+        await self._record(workflow_id, context, success=False)
+
+    async def _record(
+        self,
+        workflow_id: str,
+        context: dict[str, Any],
+        success: bool,
+        duration_ms: Optional[float] = None,
+    ) -> None:
+        started = self._started.pop(context["invocation_id"], None)
+        if duration_ms is None and started is not None:
+            duration_ms = (time.monotonic() - started) * 1000
+        await self._store.record(
+            ExecutionSample(
+                workflow_id=workflow_id,
+                finished_at=datetime.now(UTC),
+                duration_ms=duration_ms or 0.0,
+                success=success,
+            )
+        )
+
+    async def _compaction_loop(self) -> None:
+        """Periodically roll up and expire telemetry."""
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                summary = await self._store.compact()
+                logger.debug("Telemetry compaction: %s", summary)
+            except Exception:
+                logger.exception("Telemetry compaction failed")
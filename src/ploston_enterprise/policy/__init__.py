@@ -0,0 +1,14 @@
+"""Policy evaluation module for Ploston Enterprise."""
+
+from .engine import PolicyEngine, PrincipalDirectory
+from .models import Decision, EvaluationRequest, PolicyError, PolicyRule, Principal
+
+__all__ = [
+    "Decision",
+    "EvaluationRequest",
+    "PolicyEngine",
+    "PolicyError",
+    "PolicyRule",
+    "Principal",
+    "PrincipalDirectory",
+]
@@ -0,0 +1,179 @@
+"""Policy evaluation engine for Ploston Enterprise."""
+
+import fnmatch
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+from ..patterns import canonical_json
+from .models import Decision, EvaluationRequest, PolicyError, PolicyRule, Principal
+
+
+class PrincipalDirectory:
+    """Looks up principals by id.
+
+    The default directory serves principals declared in the policy
+    file; subclasses can resolve them from an identity provider.
+    Unknown principals have no roles and no attributes.
+    """
+
+    def __init__(self, principals: Optional[Iterable[Principal]] = None):
+        self._principals = {p.id: p for p in principals or ()}
+
+    def get(self, principal_id: str) -> Principal:
+        """Resolve a principal."""
+        return self._principals.get(principal_id) or Principal(id=principal_id)
+
+
+@dataclass
+class _CompiledRule:
+    """A rule with its glob patterns compiled."""
+
+    rule: PolicyRule
+    roles: frozenset[str]
+    actions: re.Pattern
+    resources: re.Pattern
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern:
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns) or "(?!)")
+
+
+def _condition_holds(expected: Any, actual: Any) -> bool:
+    if isinstance(expected, list):
+        return actual in expected
+    return actual == expected
+
+
+class PolicyEngine:
+    """Evaluates RBAC/ABAC rules.
+
+    Deny rules take precedence over allow rules; requests that match no
+    rule are denied.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Iterable[PolicyRule]] = None,
+        directory: Optional[PrincipalDirectory] = None,
+    ):
+        self._rules = list(rules or ())
+        self._directory = directory or PrincipalDirectory()
+        self._compiled: Optional[list[_CompiledRule]] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> "PolicyEngine":
+        """Load principals and rules from a YAML policy file.
+
+        Raises:
+            PolicyError: If the file is missing or malformed.
+        """
+        try:
+            data = yaml.safe_load(Path(path).read_text()) or {}
+            principals = [
+                Principal(
+                    id=principal_id,
+                    roles=list(spec.get("roles", [])),
+                    attributes=dict(spec.get("attributes", {})),
+                )
+                for principal_id, spec in (data.get("principals") or {}).items()
+            ]
+            rules = [PolicyRule.from_dict(r) for r in data.get("rules") or []]
+        except OSError as e:
+            raise PolicyError(f"Cannot read policy file: {e}", code="FILE_NOT_FOUND") from e
+        except (yaml.YAMLError, AttributeError, KeyError, TypeError) as e:
+            raise PolicyError(f"Invalid policy file {path}: {e}", code="INVALID_POLICY") from e
+        return cls(rules=rules, directory=PrincipalDirectory(principals))
+
+    @property
+    def rules(self) -> list[PolicyRule]:
+        """Configured rules, in evaluation order."""
+        return list(self._rules)
+
+    def compile(self) -> None:
+        """Compile rule patterns ahead of the first evaluation."""
+        self._compiled = [
+            _CompiledRule(
+                rule=rule,
+                roles=frozenset(rule.roles),
+                actions=_compile_globs(rule.actions),
+                resources=_compile_globs(rule.resources),
+            )
+            for rule in self._rules
+        ]
+
+    def evaluate(self, request: EvaluationRequest) -> Decision:
+        """Evaluate a single request."""
+        return self._evaluate(self._directory.get(request.principal), request)
+
+    def evaluate_batch(self, requests: Iterable[EvaluationRequest]) -> list[Decision]:
+        """Evaluate many requests in one pass.
+
+        Each distinct principal is looked up once, and identical
+        requests are evaluated once.
+
+        Args:
+            requests: Requests to evaluate.
+
+        Returns:
+            Decisions in request order.
+        """
+        principals: dict[str, Principal] = {}
+        decisions: dict[tuple, Decision] = {}
+        results = []
+        for request in requests:
+            key = (
+                request.principal,
+                request.resource,
+                request.action,
+                canonical_json(request.attributes),
+            )
+            decision = decisions.get(key)
+            if decision is None:
+                principal = principals.get(request.principal)
+                if principal is None:
+                    principal = principals[request.principal] = self._directory.get(
+                        request.principal
+                    )
+                decision = decisions[key] = self._evaluate(principal, request)
+            results.append(decision)
+        return results
+
+    def _evaluate(self, principal: Principal, request: EvaluationRequest) -> Decision:
+        if self._compiled is None:
+            self.compile()
+
+        allowed_by = None
+        roles = set(principal.roles)
+        for compiled in self._compiled:
+            if compiled.roles and not compiled.roles & roles:
+                continue
+            if not compiled.actions.match(request.action):
+                continue
+            if not compiled.resources.match(request.resource):
+                continue
+            if not self._conditions_hold(compiled.rule, principal, request):
+                continue
+            if compiled.rule.effect == "deny":
+                return Decision(allowed=False, rule=compiled.rule.id)
+            if allowed_by is None:
+                allowed_by = compiled.rule.id
+
+        return Decision(allowed=allowed_by is not None, rule=allowed_by)
+
+    @staticmethod
+    def _conditions_hold(
+        rule: PolicyRule, principal: Principal, request: EvaluationRequest
+    ) -> bool:
+        for key, expected in rule.conditions.items():
+            if key.startswith("principal."):
+                actual = principal.attributes.get(key.removeprefix("principal."))
+            else:
+                actual = request.attributes.get(key)
+            if not _condition_holds(expected, actual):
+                return False
+        return True
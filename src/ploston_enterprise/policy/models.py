@@ -0,0 +1,82 @@
+"""Policy models for Ploston Enterprise."""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+class PolicyError(Exception):
+    """Policy configuration or enforcement error."""
+
+    def __init__(self, message: str, code: str = "POLICY_ERROR"):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+@dataclass
+class Principal:
+    """A user or service that requests access."""
+
+    id: str
+    roles: list[str] = field(default_factory=list)
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PolicyRule:
+    """An allow or deny rule.
+
+    A rule applies when the principal has one of ``roles`` (any
+    principal if empty), the action and resource match one of the glob
+    patterns, and every condition holds. Condition keys prefixed with
+    ``principal.`` refer to principal attributes; other keys refer to
+    request attributes. A condition value that is a list matches any of
+    its items.
+    """
+
+    id: str
+    effect: str
+    actions: list[str] = field(default_factory=lambda: ["*"])
+    resources: list[str] = field(default_factory=lambda: ["*"])
+    roles: list[str] = field(default_factory=list)
+    conditions: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.effect not in ("allow", "deny"):
+            raise PolicyError(
+                f"Rule {self.id!r} has invalid effect {self.effect!r}", code="INVALID_RULE"
+            )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PolicyRule":
+        """Create from a policy file entry."""
+        return cls(
+            id=data["id"],
+            effect=data.get("effect", "allow"),
+            actions=list(data.get("actions", ["*"])),
+            resources=list(data.get("resources", ["*"])),
+            roles=list(data.get("roles", [])),
+            conditions=dict(data.get("conditions", {})),
+        )
+
+
+@dataclass
+class EvaluationRequest:
+    """A single authorization question."""
+
+    principal: str
+    resource: str
+    action: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Decision:
+    """Outcome of a policy evaluation."""
+
+    allowed: bool
+    rule: Optional[str] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {"allowed": self.allowed, "rule": self.rule}
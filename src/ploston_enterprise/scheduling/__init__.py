@@ -0,0 +1,16 @@
+"""Execution scheduling module for Ploston Enterprise."""
+
+from .models import DEFAULT_PRIORITY_CLASSES, PriorityClass, QueueWaitHistogram
+from .scheduler import SchedulerError, WeightedFairScheduler
+from .seats import SeatMiddleware, current_seat, seat_for_scope
+
+__all__ = [
+    "DEFAULT_PRIORITY_CLASSES",
+    "PriorityClass",
+    "QueueWaitHistogram",
+    "SchedulerError",
+    "SeatMiddleware",
+    "WeightedFairScheduler",
+    "current_seat",
+    "seat_for_scope",
+]
@@ -0,0 +1,118 @@
+"""Scheduler models for Ploston Enterprise."""
+
+import bisect
+from dataclasses import dataclass, field
+
+# Interactive executions get eight slots for every batch slot under contention
+DEFAULT_PRIORITY_CLASSES = "interactive:8,batch:1"
+
+# Upper bounds of queue-wait histogram buckets, in milliseconds
+DEFAULT_WAIT_BUCKETS_MS = (
+    1.0,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+    10000.0,
+    30000.0,
+    60000.0,
+)
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    """A scheduling class with its share of execution slots.
+
+    When several classes have queued executions, each receives slots in
+    proportion to its weight.
+    """
+
+    name: str
+    weight: float
+
+    @classmethod
+    def parse(cls, spec: str) -> list["PriorityClass"]:
+        """Parse a comma-separated ``name:weight`` list.
+
+        Args:
+            spec: Class specification, e.g. ``"interactive:8,batch:1"``.
+
+        Returns:
+            Priority classes in the given order.
+
+        Raises:
+            ValueError: If an entry is malformed or a weight is not positive.
+        """
+        classes = []
+        for entry in spec.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            name, _, weight = entry.partition(":")
+            value = float(weight) if weight else 1.0
+            if not name or value <= 0:
+                raise ValueError(f"Invalid priority class: {entry!r}")
+            classes.append(cls(name=name.strip(), weight=value))
+        return classes
+
+
+@dataclass
+class QueueWaitHistogram:
+    """Cumulative histogram of time spent waiting for an execution slot."""
+
+    bounds_ms: tuple[float, ...] = DEFAULT_WAIT_BUCKETS_MS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    sum_ms: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            # One extra bucket for observations above the largest bound
+            self.counts = [0] * (len(self.bounds_ms) + 1)
+
+    def observe(self, wait_ms: float) -> None:
+        """Record one queue wait."""
+        self.counts[bisect.bisect_left(self.bounds_ms, wait_ms)] += 1
+        self.count += 1
+        self.sum_ms += wait_ms
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of its bucket.
+
+        Returns:
+            The bucket bound, ``inf`` above the largest bound, or 0.0
+            if nothing was observed.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds_ms, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        buckets = []
+        seen = 0
+        for bound, n in zip(self.bounds_ms, self.counts):
+            seen += n
+            buckets.append({"le": bound, "count": seen})
+        buckets.append({"le": "+Inf", "count": self.count})
+        p50, p99 = self.quantile(0.5), self.quantile(0.99)
+        return {
+            "count": self.count,
+            "sum_ms": self.sum_ms,
+            # None when the quantile falls above the largest bound
+            "p50_ms": p50 if p50 != float("inf") else None,
+            "p99_ms": p99 if p99 != float("inf") else None,
+            "buckets": buckets,
+        }
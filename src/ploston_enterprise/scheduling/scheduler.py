@@ -0,0 +1,218 @@
+"""Weighted fair execution scheduler for Ploston Enterprise."""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .models import PriorityClass, QueueWaitHistogram
+
+
+class SchedulerError(Exception):
+    """Scheduler configuration or admission error."""
+
+    def __init__(self, message: str, code: str = "SCHEDULER_ERROR"):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+@dataclass
+class _Waiter:
+    """A queued execution."""
+
+    future: asyncio.Future
+    enqueued_at: float
+
+
+@dataclass
+class _ClassQueue:
+    """Queued executions of one priority class, grouped by seat."""
+
+    priority: PriorityClass
+    seats: OrderedDict[str, deque[_Waiter]] = field(default_factory=OrderedDict)
+    finish_tag: float = 0.0
+    running: int = 0
+    histogram: QueueWaitHistogram = field(default_factory=QueueWaitHistogram)
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self.seats.values())
+
+    def push(self, seat: str, waiter: _Waiter) -> None:
+        self.seats.setdefault(seat, deque()).append(waiter)
+
+    def pop(self) -> _Waiter:
+        """Pop from the next seat in round-robin order."""
+        seat, waiters = next(iter(self.seats.items()))
+        waiter = waiters.popleft()
+        del self.seats[seat]
+        if waiters:
+            self.seats[seat] = waiters
+        return waiter
+
+    def remove(self, seat: str, waiter: _Waiter) -> None:
+        waiters = self.seats.get(seat)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del self.seats[seat]
+
+
+class WeightedFairScheduler:
+    """Admits workflow executions into a fixed number of slots.
+
+    Executions run immediately while slots are free. Once all slots
+    are busy, they queue per priority class, and freed slots are handed
+    out by weighted fair queuing: each class is served in proportion to
+    its weight while it has work queued, so a burst of batch work cannot
+    starve interactive executions, and an idle class does not bank
+    credit for later. Within a class, seats are served round-robin.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        classes: Iterable[PriorityClass],
+        default_class: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Number of executions allowed to run at once.
+            classes: Priority classes to schedule across.
+            default_class: Class for executions without a known class
+                (default: the lowest-weight class).
+            clock: Monotonic clock in seconds, for queue-wait timing.
+
+        Raises:
+            SchedulerError: If the configuration is invalid.
+        """
+        self._classes = {c.name: _ClassQueue(priority=c) for c in classes}
+        if not self._classes:
+            raise SchedulerError("At least one priority class is required", code="NO_CLASSES")
+        if max_concurrent < 1:
+            raise SchedulerError("max_concurrent must be at least 1", code="INVALID_LIMIT")
+        # Unclassified work must not compete as the most favoured class
+        self._default = default_class or min(
+            self._classes, key=lambda name: self._classes[name].priority.weight
+        )
+        if self._default not in self._classes:
+            raise SchedulerError(
+                f"Unknown default priority class: {self._default}", code="UNKNOWN_CLASS"
+            )
+        self._max_concurrent = max_concurrent
+        self._clock = clock
+        self._running = 0
+        self._virtual_time = 0.0
+
+    @property
+    def classes(self) -> list[str]:
+        """Names of the configured priority classes."""
+        return list(self._classes)
+
+    @property
+    def running(self) -> int:
+        """Number of executions holding a slot."""
+        return self._running
+
+    @property
+    def queued(self) -> int:
+        """Number of executions waiting for a slot."""
+        return sum(q.queued for q in self._classes.values())
+
+    def resolve_class(self, name: Optional[str]) -> str:
+        """Map a requested class name to a configured class."""
+        return name if name in self._classes else self._default
+
+    async def acquire(self, priority_class: Optional[str] = None, seat: str = "default") -> str:
+        """Wait for an execution slot.
+
+        Args:
+            priority_class: Requested class; unknown classes use the default.
+            seat: License seat (tenant or user) the execution belongs to.
+
+        Returns:
+            The class the slot was granted under; pass it to ``release``.
+        """
+        name = self.resolve_class(priority_class)
+        queue = self._classes[name]
+
+        if self._running < self._max_concurrent and self.queued == 0:
+            self._grant(queue, wait_ms=0.0)
+            return name
+
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=self._clock(),
+        )
+        if not queue.seats:
+            # A class that was idle starts at the current virtual time
+            # instead of reusing its old finish tag
+            queue.finish_tag = max(queue.finish_tag, self._virtual_time)
+        queue.push(seat, waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just before cancellation; hand the slot on
+                self.release(name)
+            else:
+                queue.remove(seat, waiter)
+            raise
+        return name
+
+    def release(self, priority_class: str) -> None:
+        """Free the slot of a finished execution."""
+        queue = self._classes[priority_class]
+        queue.running -= 1
+        self._running -= 1
+        self._dispatch()
+
+    def _grant(self, queue: _ClassQueue, wait_ms: float) -> None:
+        queue.running += 1
+        self._running += 1
+        queue.histogram.observe(wait_ms)
+
+    def _dispatch(self) -> None:
+        """Hand free slots to queued executions in weighted fair order."""
+        while self._running < self._max_concurrent:
+            # Serve the backlogged class whose next slot finishes first in
+            # virtual time; each slot advances a class by 1 / weight.
+            backlogged = [q for q in self._classes.values() if q.seats]
+            if not backlogged:
+                return
+            best = min(backlogged, key=lambda q: q.finish_tag + 1 / q.priority.weight)
+
+            waiter = best.pop()
+            if waiter.future.done():
+                # Cancelled while queued; its task has not removed it yet
+                continue
+            self._virtual_time = best.finish_tag
+            best.finish_tag += 1 / best.priority.weight
+            self._grant(best, wait_ms=(self._clock() - waiter.enqueued_at) * 1000)
+            waiter.future.set_result(None)
+
+    def stats(self) -> dict:
+        """Get slot usage and per-class queue-wait histograms."""
+        return {
+            "max_concurrent": self._max_concurrent,
+            "running": self._running,
+            "queued": self.queued,
+            "classes": {
+                name: {
+                    "weight": q.priority.weight,
+                    "running": q.running,
+                    "queued": q.queued,
+                    "queue_wait": q.histogram.to_dict(),
+                }
+                for name, q in self._classes.items()
+            },
+        }
@@ -0,0 +1,55 @@
+"""Caller identification for per-seat scheduling."""
+
+from contextvars import ContextVar
+from typing import Optional
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_current_seat: ContextVar[Optional[str]] = ContextVar("ploston_seat", default=None)
+
+
+def current_seat() -> Optional[str]:
+    """Get the seat of the HTTP request being handled, if any."""
+    return _current_seat.get()
+
+
+def seat_for_scope(scope: Scope) -> str:
+    """Identify the caller of an HTTP request.
+
+    Uses the same client identity as the core rate limiter: the API key
+    if one is sent, otherwise the forwarded or direct client address.
+    """
+    headers = Headers(scope=scope)
+    api_key = headers.get("X-API-Key")
+    if api_key:
+        return f"key:{api_key[:8]}"
+
+    forwarded = headers.get("X-Forwarded-For")
+    if forwarded:
+        return f"ip:{forwarded.split(',')[0].strip()}"
+
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class SeatMiddleware:
+    """ASGI middleware that records the caller of each HTTP request.
+
+    Workflow executions started while handling the request see the
+    caller through ``current_seat``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _current_seat.set(seat_for_scope(scope))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_seat.reset(token)
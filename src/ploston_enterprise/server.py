@@ -5,19 +5,60 @@ license validation and enterprise feature configuration.
 """
 
 import asyncio
+import contextlib
 import os
+import signal
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
 from typing import Optional
 
+import uvicorn
+from fastapi import FastAPI
 from ploston_core import PlostApplication
 from ploston_core.extensions import (
     FeatureFlagRegistry,
+    PluginRegistry,
+    get_capabilities_provider,
     set_capabilities_provider,
 )
+from ploston_core.extensions.plugins import AELPlugin
+from ploston_core.mcp_frontend import HTTPTransport
 from ploston_core.types import MCPTransport
+from starlette.routing import Mount
 
+from .api import (
+    ENTERPRISE_API_PREFIX,
+    PROBE_PREFIX,
+    create_enterprise_router,
+    create_probe_router,
+)
+from .cache import StepResultCache
 from .capabilities import EnterpriseCapabilitiesProvider
 from .defaults import get_enterprise_feature_flags
+from .hooks import install_workflow_hooks
 from .license import LicenseError, LicenseValidator
+from .lifecycle import ReadinessState, shutdown_plugins, startup_plugins
+from .patterns import UNMEMOIZABLE_TOOLS
+from .plugins import (
+    DiagnosticsPlugin,
+    DrainPlugin,
+    PatternsPlugin,
+    PolicyPlugin,
+    SchedulerPlugin,
+    StepCachePlugin,
+    TelemetryPlugin,
+)
+from .policy import PolicyEngine
+from .scheduling import (
+    DEFAULT_PRIORITY_CLASSES,
+    PriorityClass,
+    SeatMiddleware,
+    WeightedFairScheduler,
+)
+from .telemetry import RetentionPolicy, TieredTelemetryStore
+
+# Same location the core telemetry store uses for its SQLite file
+DEFAULT_DATA_DIR = "./data"
 
 
 def _validate_license_and_setup():
@@ -56,12 +97,412 @@ def _validate_license_and_setup():
     # Set enterprise capabilities provider
     from . import __version__
 
-    provider = EnterpriseCapabilitiesProvider(license_info, __version__)
+    provider = EnterpriseCapabilitiesProvider(__version__, license_info)
     set_capabilities_provider(provider)
 
     return license_info
 
 
+@dataclass
+class EnterprisePlugins:
+    """Enterprise plugins registered for a server instance."""
+
+    drain: DrainPlugin
+    policy: Optional[PolicyPlugin] = None
+    patterns: Optional[PatternsPlugin] = None
+    step_cache: Optional[StepCachePlugin] = None
+    scheduler: Optional[SchedulerPlugin] = None
+    telemetry: Optional[TelemetryPlugin] = None
+    diagnostics: Optional[DiagnosticsPlugin] = None
+
+    def all(self) -> list[AELPlugin]:
+        """Get all registered plugins."""
+        plugins = (
+            self.drain,
+            self.policy,
+            self.patterns,
+            self.step_cache,
+            self.telemetry,
+            self.scheduler,
+            self.diagnostics,
+        )
+        return [p for p in plugins if p is not None]
+
+
+def _get_rest_app(app: PlostApplication) -> Optional[FastAPI]:
+    """Get the core REST API app (None in MCP-only mode).
+
+    PlostApplication hands the REST app to the MCP frontend without
+    keeping a public reference to it.
+    """
+    return getattr(app.mcp_frontend, "_rest_app", None)
+
+
+def _setup_enterprise_plugins(
+    app: PlostApplication,
+    readiness: ReadinessState,
+    diagnostics: bool = False,
+    slow_callback_ms: float = 100.0,
+) -> EnterprisePlugins:
+    """Register licensed enterprise plugins and mount the enterprise API.
+
+    Args:
+        app: Initialized application.
+        readiness: Server readiness state reported by the probe endpoints.
+        diagnostics: Enable the diagnostics plugin and its admin endpoints.
+        slow_callback_ms: Event-loop block duration reported as a slow callback.
+
+    Returns:
+        The registered plugins.
+    """
+    flags = FeatureFlagRegistry.flags()
+    registry = PluginRegistry.get()
+
+    drain = DrainPlugin()
+    registry.register(drain)
+
+    # Checked before any other plugin does work for the execution
+    policy = None
+    if flags.policy:
+        policy_file = os.environ.get("PLOSTON_POLICY_FILE")
+        policy = PolicyPlugin(engine=PolicyEngine.from_file(policy_file) if policy_file else None)
+        registry.register(policy)
+
+    patterns = None
+    if flags.patterns:
+        patterns = PatternsPlugin(workflow_registry=app.workflow_registry)
+        patterns.observe_tool_calls(app.tool_invoker)
+        registry.register(patterns)
+
+    # Step result caching is opt-in per tool; memoization recommendations
+    # are never applied automatically
+    step_cache = None
+    if os.environ.get("PLOSTON_STEP_CACHE_ENABLED", "").lower() in ("1", "true", "yes"):
+        tools = os.environ.get("PLOSTON_STEP_CACHE_TOOLS", "")
+        tools = [t.strip() for t in tools.split(",") if t.strip()]
+        for tool in UNMEMOIZABLE_TOOLS.intersection(tools):
+            print(f"[Ploston Enterprise] Step cache: {tool} is never cached", flush=True)
+        step_cache = StepCachePlugin(
+            cache=StepResultCache(
+                ttl_seconds=float(os.environ.get("PLOSTON_STEP_CACHE_TTL", "300")),
+            ),
+            tools=tools,
+        )
+        step_cache.attach(app.tool_invoker)
+        registry.register(step_cache)
+
+    telemetry = None
+    if flags.telemetry_retention_days:
+        data_dir = os.environ.get("PLOSTON_DATA_DIR", DEFAULT_DATA_DIR)
+        telemetry = TelemetryPlugin(
+            store=TieredTelemetryStore(
+                db_path=os.environ.get(
+                    "PLOSTON_TELEMETRY_DB", os.path.join(data_dir, "enterprise-telemetry.db")
+                ),
+                policy=RetentionPolicy(
+                    raw_days=int(os.environ.get("PLOSTON_TELEMETRY_RAW_DAYS", "7")),
+                    hourly_days=int(os.environ.get("PLOSTON_TELEMETRY_HOURLY_DAYS", "30")),
+                    daily_days=flags.telemetry_retention_days,
+                ),
+            ),
+        )
+        registry.register(telemetry)
+
+    # Registered after the plugins that act on executions, so executions
+    # only hold a slot while they actually run
+    scheduler = None
+    if "scheduler" in flags.enabled_plugins and flags.max_concurrent_executions:
+        workflow_classes = {}
+        for mapping in os.environ.get("PLOSTON_SCHEDULER_WORKFLOWS", "").split(","):
+            workflow_id, _, priority_class = mapping.partition("=")
+            if workflow_id.strip() and priority_class.strip():
+                workflow_classes[workflow_id.strip()] = priority_class.strip()
+        scheduler = SchedulerPlugin(
+            WeightedFairScheduler(
+                max_concurrent=flags.max_concurrent_executions,
+                classes=PriorityClass.parse(
+                    os.environ.get("PLOSTON_SCHEDULER_CLASSES", DEFAULT_PRIORITY_CLASSES)
+                ),
+            ),
+            workflow_classes=workflow_classes,
+        )
+        registry.register(scheduler)
+
+    # Opt-in profiling; nothing is measured unless enabled
+    diagnostics_plugin = None
+    if diagnostics:
+        diagnostics_plugin = DiagnosticsPlugin(slow_callback_ms=slow_callback_ms)
+        registry.register(diagnostics_plugin)
+
+    install_workflow_hooks(app.workflow_engine, registry)
+
+    rest_app = _get_rest_app(app)
+    if rest_app is not None:
+        router = create_enterprise_router(
+            patterns=patterns,
+            step_cache=step_cache,
+            scheduler=scheduler,
+            telemetry=telemetry,
+            policy=policy,
+            diagnostics=diagnostics_plugin,
+        )
+        rest_app.include_router(router, prefix=ENTERPRISE_API_PREFIX)
+        rest_app.include_router(create_probe_router(readiness), prefix=PROBE_PREFIX)
+
+    return EnterprisePlugins(
+        drain=drain,
+        policy=policy,
+        patterns=patterns,
+        step_cache=step_cache,
+        scheduler=scheduler,
+        telemetry=telemetry,
+        diagnostics=diagnostics_plugin,
+    )
+
+
+async def _warm_up(
+    plugins: EnterprisePlugins,
+    readiness: ReadinessState,
+    plugin_timeout: float,
+) -> None:
+    """Start plugins and prime caches, then mark the server ready.
+
+    Plugins that fail or time out are reported but do not keep the
+    server out of rotation.
+
+    Args:
+        plugins: Registered enterprise plugins.
+        readiness: Server readiness state.
+        plugin_timeout: Per-plugin ``on_startup`` timeout.
+    """
+    readiness.start_warming()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    outcomes = await startup_plugins(plugins.all(), timeout=plugin_timeout)
+    provider = get_capabilities_provider()
+    if isinstance(provider, EnterpriseCapabilitiesProvider):
+        provider.prime()
+        outcomes["capabilities"] = "ok"
+
+    for name, outcome in outcomes.items():
+        if outcome != "ok":
+            print(f"[Ploston Enterprise] Warm-up of {name}: {outcome}", flush=True)
+    readiness.mark_ready(outcomes)
+    print(
+        f"[Ploston Enterprise] Warm-up finished in {loop.time() - started:.2f}s",
+        flush=True,
+    )
+
+
+async def _graceful_shutdown(
+    app: PlostApplication,
+    plugins: EnterprisePlugins,
+    readiness: ReadinessState,
+    drain_timeout: float,
+    plugin_timeout: float,
+    force: asyncio.Event,
+    stop_serving: Optional[Callable[[], Awaitable[None]]] = None,
+) -> None:
+    """Drain in-flight executions, flush plugins and stop the application.
+
+    Readiness is flipped first and connections are still accepted while
+    the drain runs, so load balancers see a failing readiness probe and
+    new executions are rejected with ServerDrainingError rather than a
+    refused connection.
+
+    Args:
+        app: Running application.
+        plugins: Registered enterprise plugins.
+        readiness: Server readiness state.
+        drain_timeout: Maximum time to wait for in-flight executions.
+        plugin_timeout: Per-plugin ``on_shutdown`` timeout.
+        force: Event that cuts the drain short when set.
+        stop_serving: Closes the listener once the drain is over.
+    """
+    readiness.start_draining()
+    tracker = plugins.drain.tracker
+    tracker.start_draining()
+    print(
+        f"[Ploston Enterprise] Draining {tracker.in_flight} in-flight execution(s) "
+        f"(deadline: {drain_timeout:g}s)...",
+        flush=True,
+    )
+
+    idle = asyncio.create_task(tracker.wait_idle(drain_timeout))
+    forced = asyncio.create_task(force.wait())
+    await asyncio.wait({idle, forced}, return_when=asyncio.FIRST_COMPLETED)
+    forced.cancel()
+    if not idle.done():
+        idle.cancel()
+        print("[Ploston Enterprise] Drain interrupted, shutting down now", flush=True)
+    elif not idle.result():
+        print(
+            f"[Ploston Enterprise] Drain deadline reached with {tracker.in_flight} "
+            "execution(s) still running",
+            flush=True,
+        )
+
+    if stop_serving is not None:
+        await stop_serving()
+
+    outcomes = await shutdown_plugins(plugins.all(), timeout=plugin_timeout)
+    for name, outcome in outcomes.items():
+        if outcome != "ok":
+            print(f"[Ploston Enterprise] Plugin {name} shutdown: {outcome}", flush=True)
+
+    await app.shutdown()
+
+
+class _ManagedServer(uvicorn.Server):
+    """Uvicorn server that leaves SIGTERM/SIGINT handling to its caller.
+
+    Uvicorn closes its listener as soon as it receives a signal and
+    re-raises the signal after stopping. The enterprise server instead
+    keeps serving while it drains and then sets ``should_exit`` itself.
+    """
+
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        """Leave signal handlers untouched (uvicorn >= 0.29)."""
+        yield
+
+    def install_signal_handlers(self) -> None:
+        """Leave signal handlers untouched (uvicorn < 0.29)."""
+
+
+def _create_http_server(
+    app: PlostApplication,
+    readiness: ReadinessState,
+    diagnostics: Optional[DiagnosticsPlugin] = None,
+) -> uvicorn.Server:
+    """Create the MCP/REST HTTP server of an initialized application.
+
+    Mirrors the HTTP startup of the MCP frontend, which creates and runs
+    its uvicorn server internally, so the enterprise server decides when
+    the listener closes. The probe endpoints are mounted on the listener
+    itself, so they are served with and without the REST API, and each
+    request's caller is recorded for per-seat scheduling. Without the
+    REST API, the diagnostics admin endpoints are mounted on the
+    listener too, at the path they have in the REST API.
+
+    Args:
+        app: Initialized application (HTTP transport).
+        readiness: Server readiness state reported by the probe endpoints.
+        diagnostics: Diagnostics plugin, if diagnostics mode is enabled.
+
+    Returns:
+        Server that is started with ``serve()`` and stopped by setting
+        ``should_exit``.
+    """
+    frontend = app.mcp_frontend
+    http_config = frontend._http_config
+    transport = HTTPTransport(
+        message_handler=frontend._handle_message,
+        host=http_config.host,
+        port=http_config.port,
+        cors_origins=http_config.cors_origins,
+        tls_enabled=http_config.tls.enabled,
+        tls_cert_file=http_config.tls.cert_file,
+        tls_key_file=http_config.tls.key_file,
+        rest_app=frontend._rest_app,
+        rest_prefix=frontend._rest_prefix,
+    )
+    # The frontend sends tools/list_changed notifications through it
+    frontend._http_transport = transport
+    frontend._running = True
+    transport.start()
+
+    probes = FastAPI(openapi_url=None)
+    probes.include_router(create_probe_router(readiness))
+    transport.app.router.routes.append(Mount(PROBE_PREFIX, app=probes))
+
+    if diagnostics is not None and frontend._rest_app is None:
+        admin = FastAPI(openapi_url=None)
+        admin.include_router(create_enterprise_router(diagnostics=diagnostics))
+        prefix = f"{frontend._rest_prefix}{ENTERPRISE_API_PREFIX}"
+        transport.app.router.routes.append(Mount(prefix, app=admin))
+
+    config = uvicorn.Config(
+        SeatMiddleware(transport.app),
+        host=http_config.host,
+        port=http_config.port,
+        log_level="info",
+    )
+    if http_config.tls.enabled:
+        config.ssl_certfile = http_config.tls.cert_file
+        config.ssl_keyfile = http_config.tls.key_file
+    return _ManagedServer(config)
+
+
+async def _serve(
+    app: PlostApplication,
+    plugins: EnterprisePlugins,
+    readiness: ReadinessState,
+    http_server: uvicorn.Server,
+    warmup_timeout: float,
+    drain_timeout: float,
+    plugin_timeout: float,
+) -> None:
+    """Serve until SIGTERM/SIGINT, then shut down gracefully.
+
+    Liveness probes are served while plugins warm up. The first signal
+    starts the drain; a second one skips the rest of the drain and
+    stops the listener without waiting for open connections.
+
+    Args:
+        app: Initialized application.
+        plugins: Registered enterprise plugins.
+        readiness: Server readiness state.
+        http_server: HTTP server created by ``_create_http_server``.
+        warmup_timeout: Per-plugin ``on_startup`` timeout.
+        drain_timeout: Maximum time to wait for in-flight executions.
+        plugin_timeout: Per-plugin ``on_shutdown`` timeout.
+    """
+    stop = asyncio.Event()
+    force = asyncio.Event()
+
+    def _on_signal():
+        if stop.is_set():
+            force.set()
+            http_server.force_exit = True
+        stop.set()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, _on_signal)
+
+    try:
+        serve = asyncio.create_task(http_server.serve())
+        warm_up = asyncio.create_task(_warm_up(plugins, readiness, plugin_timeout=warmup_timeout))
+        stopped = asyncio.create_task(stop.wait())
+        await asyncio.wait({serve, stopped}, return_when=asyncio.FIRST_COMPLETED)
+        stopped.cancel()
+        if serve.done():
+            # Server stopped on its own; re-raise its error, if any
+            serve.result()
+
+        print("\n[Ploston Enterprise] Shutting down...", flush=True)
+        warm_up.cancel()
+
+        async def stop_serving() -> None:
+            http_server.should_exit = True
+            await asyncio.gather(serve, return_exceptions=True)
+
+        await _graceful_shutdown(
+            app,
+            plugins,
+            readiness,
+            drain_timeout=drain_timeout,
+            plugin_timeout=plugin_timeout,
+            force=force,
+            stop_serving=stop_serving,
+        )
+    finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
+
+
 async def create_server(
     config_path: Optional[str] = None,
     host: str = "0.0.0.0",
@@ -77,7 +518,7 @@ async def create_server(
         with_rest_api: Enable REST API alongside MCP (default: True)
 
     Returns:
-        Configured PlostApplication instance (initialized).
+        Configured PlostApplication instance (initialized and warmed up).
 
     Raises:
         SystemExit: If license validation fails.
@@ -95,6 +536,9 @@ async def create_server(
         rest_api_docs=True,
     )
     await app.initialize()
+    readiness = ReadinessState()
+    plugins = _setup_enterprise_plugins(app, readiness)
+    await _warm_up(plugins, readiness, plugin_timeout=30.0)
     return app
 
 
@@ -107,6 +551,36 @@ def main():
     parser.add_argument("-p", "--port", type=int, default=8080, help="HTTP port")
     parser.add_argument("--host", default="0.0.0.0", help="HTTP host")
     parser.add_argument("--no-rest", action="store_true", help="Disable REST API (MCP only)")
+    parser.add_argument(
+        "--drain-timeout",
+        type=float,
+        default=float(os.environ.get("PLOSTON_DRAIN_TIMEOUT", "6")),
+        help="Seconds to wait for in-flight executions on shutdown",
+    )
+    parser.add_argument(
+        "--plugin-shutdown-timeout",
+        type=float,
+        default=float(os.environ.get("PLOSTON_PLUGIN_SHUTDOWN_TIMEOUT", "2")),
+        help="Seconds each plugin may take to flush on shutdown",
+    )
+    parser.add_argument(
+        "--warmup-timeout",
+        type=float,
+        default=float(os.environ.get("PLOSTON_WARMUP_TIMEOUT", "30")),
+        help="Seconds each plugin may take to warm up before the server reports ready",
+    )
+    parser.add_argument(
+        "--diagnostics",
+        action="store_true",
+        default=os.environ.get("PLOSTON_DIAGNOSTICS", "").lower() in ("1", "true", "yes"),
+        help="Measure event-loop lag, slow callbacks, GC pauses and plugin allocations",
+    )
+    parser.add_argument(
+        "--slow-callback-ms",
+        type=float,
+        default=float(os.environ.get("PLOSTON_SLOW_CALLBACK_MS", "100")),
+        help="Report event-loop blocks longer than this (with --diagnostics)",
+    )
     args = parser.parse_args()
 
     # Validate license first (exits if invalid)
@@ -130,17 +604,37 @@ def main():
             flush=True,
         )
         print(
-            f"[Ploston Enterprise] License: {license_info.tier} (expires: {license_info.expires_at})",
+            f"[Ploston Enterprise] License: {license_info.customer} "
+            f"(expires: {license_info.expires:%Y-%m-%d})",
             flush=True,
         )
 
         try:
             await app.initialize()
+            readiness = ReadinessState()
+            plugins = _setup_enterprise_plugins(
+                app,
+                readiness,
+                diagnostics=args.diagnostics,
+                slow_callback_ms=args.slow_callback_ms,
+            )
             print("[Ploston Enterprise] Server initialized successfully", flush=True)
-            await app.start()
-        except KeyboardInterrupt:
-            print("\n[Ploston Enterprise] Shutting down...", flush=True)
-            await app.shutdown()
+            if args.diagnostics:
+                print(
+                    "[Ploston Enterprise] Diagnostics mode enabled "
+                    "(/api/v1/enterprise/admin/diagnostics)",
+                    flush=True,
+                )
+
+            await _serve(
+                app,
+                plugins,
+                readiness,
+                _create_http_server(app, readiness, plugins.diagnostics),
+                warmup_timeout=args.warmup_timeout,
+                drain_timeout=args.drain_timeout,
+                plugin_timeout=args.plugin_shutdown_timeout,
+            )
         except Exception as e:
             print(f"[Ploston Enterprise] Error: {e}", flush=True)
             await app.shutdown()
@@ -0,0 +1,14 @@
+"""Telemetry retention module for Ploston Enterprise."""
+
+from .models import ExecutionSample, Resolution, RetentionPolicy, Rollup
+from .sketch import QuantileSketch
+from .store import TieredTelemetryStore
+
+__all__ = [
+    "ExecutionSample",
+    "QuantileSketch",
+    "Resolution",
+    "RetentionPolicy",
+    "Rollup",
+    "TieredTelemetryStore",
+]
@@ -0,0 +1,103 @@
+"""Telemetry retention models for Ploston Enterprise."""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+from typing import Any
+
+from .sketch import QuantileSketch
+
+
+class Resolution(str, Enum):
+    """Rollup bucket size."""
+
+    HOURLY = "hourly"
+    DAILY = "daily"
+
+    @property
+    def interval(self) -> timedelta:
+        """Length of one bucket."""
+        return timedelta(hours=1) if self is Resolution.HOURLY else timedelta(days=1)
+
+    def bucket_start(self, timestamp: datetime) -> datetime:
+        """Get the start of the bucket containing ``timestamp``."""
+        start = timestamp.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+        if self is Resolution.DAILY:
+            start = start.replace(hour=0)
+        return start
+
+
+@dataclass
+class RetentionPolicy:
+    """How long each telemetry tier is kept.
+
+    Raw execution records are rolled up into hourly aggregates as soon
+    as their hour is over and deleted after ``raw_days``. Hourly
+    aggregates are rolled up into daily aggregates as soon as their day
+    is over and deleted after ``hourly_days``.
+    """
+
+    raw_days: int = 7
+    hourly_days: int = 30
+    daily_days: int = 365
+
+    def __post_init__(self):
+        if min(self.raw_days, self.hourly_days, self.daily_days) < 1:
+            raise ValueError("Retention periods must be at least one day")
+
+
+@dataclass
+class ExecutionSample:
+    """Raw telemetry for one workflow execution."""
+
+    workflow_id: str
+    finished_at: datetime
+    duration_ms: float
+    success: bool
+
+
+@dataclass
+class Rollup:
+    """Aggregated executions of one workflow over one bucket."""
+
+    workflow_id: str
+    resolution: Resolution
+    bucket_start: datetime
+    count: int = 0
+    errors: int = 0
+    sum_ms: float = 0.0
+    sketch: QuantileSketch = field(default_factory=QuantileSketch)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of executions that failed."""
+        return self.errors / self.count if self.count else 0.0
+
+    def add(self, sample: ExecutionSample) -> None:
+        """Aggregate a raw execution."""
+        self.count += 1
+        self.errors += 0 if sample.success else 1
+        self.sum_ms += sample.duration_ms
+        self.sketch.add(sample.duration_ms)
+
+    def merge(self, other: "Rollup") -> None:
+        """Aggregate another rollup of the same workflow."""
+        self.count += other.count
+        self.errors += other.errors
+        self.sum_ms += other.sum_ms
+        self.sketch.merge(other.sketch)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "workflow_id": self.workflow_id,
+            "resolution": self.resolution.value,
+            "bucket_start": self.bucket_start.isoformat(),
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "mean_ms": self.sum_ms / self.count if self.count else 0.0,
+            "p50_ms": self.sketch.quantile(0.5),
+            "p95_ms": self.sketch.quantile(0.95),
+            "p99_ms": self.sketch.quantile(0.99),
+        }
@@ -0,0 +1,104 @@
+"""Mergeable quantile sketch for telemetry rollups."""
+
+import math
+from typing import Any
+
+
+class QuantileSketch:
+    """Quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically spaced buckets, so any
+    quantile is estimated within ``relative_accuracy`` of the true
+    value and sketches of different periods merge exactly. Size grows
+    with the spread of observed values, not with their number; past
+    ``max_buckets`` the lowest buckets are collapsed, which keeps the
+    upper quantiles accurate.
+    """
+
+    # Values at or below this are counted as zero (durations in ms)
+    MIN_VALUE = 1e-3
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self._accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._max_buckets = max_buckets
+        self._buckets: dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+
+    @property
+    def relative_accuracy(self) -> float:
+        """Guaranteed relative error of quantile estimates."""
+        return self._accuracy
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value."""
+        self.count += count
+        if value <= self.MIN_VALUE:
+            self._zero += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + count
+        if len(self._buckets) > self._max_buckets:
+            self._collapse()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add all values recorded by another sketch.
+
+        Raises:
+            ValueError: If the sketches use different accuracies.
+        """
+        if other._accuracy != self._accuracy:
+            raise ValueError("Cannot merge sketches with different accuracies")
+        self.count += other.count
+        self._zero += other._zero
+        for key, n in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + n
+        if len(self._buckets) > self._max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """Estimate the value at quantile ``q`` (0.0 - 1.0).
+
+        Returns:
+            The estimate, or 0.0 if nothing was recorded.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                return 2 * self._gamma**key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets together to respect ``max_buckets``."""
+        keys = sorted(self._buckets)
+        excess = len(keys) - self._max_buckets
+        target = keys[excess]
+        for key in keys[:excess]:
+            self._buckets[target] += self._buckets.pop(key)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a compact dictionary for storage."""
+        return {
+            "accuracy": self._accuracy,
+            "zero": self._zero,
+            "buckets": {str(k): n for k, n in self._buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        """Create from a dictionary produced by ``to_dict``."""
+        sketch = cls(relative_accuracy=data["accuracy"])
+        sketch._zero = data["zero"]
+        sketch._buckets = {int(k): n for k, n in data["buckets"].items()}
+        sketch.count = sketch._zero + sum(sketch._buckets.values())
+        return sketch
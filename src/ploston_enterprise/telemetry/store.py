@@ -0,0 +1,319 @@
+"""Tiered telemetry store for Ploston Enterprise."""
+
+import asyncio
+import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from .models import ExecutionSample, Resolution, RetentionPolicy, Rollup
+from .sketch import QuantileSketch
+
+
+def _epoch(timestamp: datetime) -> float:
+    """Convert to epoch seconds, reading naive timestamps as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.timestamp()
+
+
+class TieredTelemetryStore:
+    """SQLite store of execution telemetry with downsampling rollups.
+
+    Data lives in three tiers: raw execution records, hourly rollups
+    and daily rollups. ``compact`` rolls closed hours and days up into
+    the next tier and deletes data past its retention period, so
+    storage stays bounded by the retention policy rather than by
+    traffic. Trend queries only read rollups.
+    """
+
+    def __init__(self, db_path: str = ":memory:", policy: Optional[RetentionPolicy] = None):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite database file (default: in-memory).
+            policy: Retention periods per tier.
+        """
+        self._db_path = db_path
+        self._policy = policy or RetentionPolicy()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._init_db()
+
+    @property
+    def policy(self) -> RetentionPolicy:
+        """Retention periods per tier."""
+        return self._policy
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        # Must precede table creation; lets compaction return freed pages
+        self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS raw_executions (
+                workflow_id TEXT NOT NULL,
+                finished_at REAL NOT NULL,
+                duration_ms REAL NOT NULL,
+                success INTEGER NOT NULL,
+                rolled INTEGER NOT NULL DEFAULT 0
+            );
+
+            CREATE TABLE IF NOT EXISTS rollups (
+                resolution TEXT NOT NULL,
+                workflow_id TEXT NOT NULL,
+                bucket_start REAL NOT NULL,
+                count INTEGER NOT NULL,
+                errors INTEGER NOT NULL,
+                sum_ms REAL NOT NULL,
+                sketch TEXT NOT NULL,
+                rolled INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (resolution, workflow_id, bucket_start)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_raw_finished ON raw_executions(finished_at);
+            CREATE INDEX IF NOT EXISTS idx_rollups_bucket ON rollups(resolution, bucket_start);
+        """
+        )
+        self._conn.commit()
+
+    async def _run(self, fn, *args):
+        """Run a synchronous database operation on the store thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    async def record(self, sample: ExecutionSample) -> None:
+        """Store a raw execution record."""
+        await self._run(self._record_sync, sample)
+
+    def _record_sync(self, sample: ExecutionSample) -> None:
+        self._conn.execute(
+            "INSERT INTO raw_executions (workflow_id, finished_at, duration_ms, success) "
+            "VALUES (?, ?, ?, ?)",
+            (
+                sample.workflow_id,
+                _epoch(sample.finished_at),
+                sample.duration_ms,
+                int(sample.success),
+            ),
+        )
+        self._conn.commit()
+
+    async def compact(self, now: Optional[datetime] = None) -> dict[str, int]:
+        """Roll up closed periods and delete expired data.
+
+        Args:
+            now: Current time (default: now, UTC).
+
+        Returns:
+            Number of rows rolled up or deleted per step.
+        """
+        return await self._run(self._compact_sync, now or datetime.now(UTC))
+
+    def _compact_sync(self, now: datetime) -> dict[str, int]:
+        hour_end = Resolution.HOURLY.bucket_start(now).timestamp()
+        day_end = Resolution.DAILY.bucket_start(now).timestamp()
+        summary = {}
+
+        with self._conn:
+            # Raw records of closed hours -> hourly rollups
+            rows = self._conn.execute(
+                "SELECT workflow_id, finished_at, duration_ms, success FROM raw_executions "
+                "WHERE rolled = 0 AND finished_at < ?",
+                (hour_end,),
+            ).fetchall()
+            hourly: dict[tuple[str, datetime], Rollup] = {}
+            for workflow_id, finished_at, duration_ms, success in rows:
+                sample = ExecutionSample(
+                    workflow_id=workflow_id,
+                    finished_at=datetime.fromtimestamp(finished_at, UTC),
+                    duration_ms=duration_ms,
+                    success=bool(success),
+                )
+                bucket = Resolution.HOURLY.bucket_start(sample.finished_at)
+                rollup = hourly.get((workflow_id, bucket))
+                if rollup is None:
+                    rollup = hourly[(workflow_id, bucket)] = Rollup(
+                        workflow_id, Resolution.HOURLY, bucket
+                    )
+                rollup.add(sample)
+            for rollup in hourly.values():
+                if self._merge_rollup(rollup):
+                    # Late records for an hour already folded into its day
+                    self._merge_rollup(self._as_daily(rollup))
+            self._conn.execute(
+                "UPDATE raw_executions SET rolled = 1 WHERE rolled = 0 AND finished_at < ?",
+                (hour_end,),
+            )
+            summary["raw_rolled_up"] = len(rows)
+
+            # Hourly rollups of closed days -> daily rollups
+            closed_hours = self._load_rollups(
+                "resolution = ? AND rolled = 0 AND bucket_start < ?",
+                (Resolution.HOURLY.value, day_end),
+            )
+            daily: dict[tuple[str, datetime], Rollup] = {}
+            for rollup in closed_hours:
+                day = self._as_daily(rollup)
+                existing = daily.get((day.workflow_id, day.bucket_start))
+                if existing is None:
+                    daily[(day.workflow_id, day.bucket_start)] = day
+                else:
+                    existing.merge(day)
+            for rollup in daily.values():
+                self._merge_rollup(rollup)
+            self._conn.execute(
+                "UPDATE rollups SET rolled = 1 "
+                "WHERE resolution = ? AND rolled = 0 AND bucket_start < ?",
+                (Resolution.HOURLY.value, day_end),
+            )
+            summary["hourly_rolled_up"] = len(closed_hours)
+
+            # Expire each tier; only data that was already rolled up
+            summary["raw_deleted"] = self._conn.execute(
+                "DELETE FROM raw_executions WHERE rolled = 1 AND finished_at < ?",
+                (self._cutoff(now, self._policy.raw_days),),
+            ).rowcount
+            summary["hourly_deleted"] = self._conn.execute(
+                "DELETE FROM rollups WHERE resolution = ? AND rolled = 1 AND bucket_start < ?",
+                (Resolution.HOURLY.value, self._cutoff(now, self._policy.hourly_days)),
+            ).rowcount
+            summary["daily_deleted"] = self._conn.execute(
+                "DELETE FROM rollups WHERE resolution = ? AND bucket_start < ?",
+                (Resolution.DAILY.value, self._cutoff(now, self._policy.daily_days)),
+            ).rowcount
+
+        # Run as a script: stepped through execute(), the pragma frees a
+        # single page per call instead of emptying the freelist
+        self._conn.executescript("PRAGMA incremental_vacuum;")
+        return summary
+
+    @staticmethod
+    def _cutoff(now: datetime, days: int) -> float:
+        return (now - timedelta(days=days)).timestamp()
+
+    @staticmethod
+    def _as_daily(rollup: Rollup) -> Rollup:
+        """Copy an hourly rollup into its daily bucket."""
+        day = Rollup(
+            rollup.workflow_id,
+            Resolution.DAILY,
+            Resolution.DAILY.bucket_start(rollup.bucket_start),
+        )
+        day.merge(rollup)
+        return day
+
+    def _merge_rollup(self, rollup: Rollup) -> bool:
+        """Add a rollup to the stored bucket, creating it if needed.
+
+        Returns:
+            Whether the stored bucket had already been rolled up further.
+        """
+        key = (rollup.resolution.value, rollup.workflow_id, rollup.bucket_start.timestamp())
+        existing = self._load_rollups(
+            "resolution = ? AND workflow_id = ? AND bucket_start = ?", key
+        )
+        rolled = False
+        if existing:
+            stored = existing[0]
+            stored.merge(rollup)
+            rollup = stored
+            rolled = bool(
+                self._conn.execute(
+                    "SELECT rolled FROM rollups "
+                    "WHERE resolution = ? AND workflow_id = ? AND bucket_start = ?",
+                    key,
+                ).fetchone()[0]
+            )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO rollups "
+            "(resolution, workflow_id, bucket_start, count, errors, sum_ms, sketch, rolled) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                *key,
+                rollup.count,
+                rollup.errors,
+                rollup.sum_ms,
+                json.dumps(rollup.sketch.to_dict(), separators=(",", ":")),
+                int(rolled),
+            ),
+        )
+        return rolled
+
+    def _load_rollups(self, where: str, params: tuple) -> list[Rollup]:
+        rows = self._conn.execute(
+            "SELECT resolution, workflow_id, bucket_start, count, errors, sum_ms, sketch "
+            f"FROM rollups WHERE {where} ORDER BY bucket_start, workflow_id",
+            params,
+        ).fetchall()
+        return [
+            Rollup(
+                workflow_id=workflow_id,
+                resolution=Resolution(resolution),
+                bucket_start=datetime.fromtimestamp(bucket_start, UTC),
+                count=count,
+                errors=errors,
+                sum_ms=sum_ms,
+                sketch=QuantileSketch.from_dict(json.loads(sketch)),
+            )
+            for resolution, workflow_id, bucket_start, count, errors, sum_ms, sketch in rows
+        ]
+
+    async def query(
+        self,
+        resolution: Resolution,
+        workflow_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> list[Rollup]:
+        """Get rollups of closed periods.
+
+        Args:
+            resolution: Bucket size.
+            workflow_id: Restrict to a single workflow (default: all workflows).
+            since: Earliest bucket start (inclusive).
+            until: Latest bucket start (exclusive).
+
+        Returns:
+            Rollups ordered by bucket start.
+        """
+        where = ["resolution = ?"]
+        params: list = [resolution.value]
+        if workflow_id is not None:
+            where.append("workflow_id = ?")
+            params.append(workflow_id)
+        if since is not None:
+            where.append("bucket_start >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            where.append("bucket_start < ?")
+            params.append(_epoch(until))
+        return await self._run(self._load_rollups, " AND ".join(where), tuple(params))
+
+    async def stats(self) -> dict[str, int]:
+        """Get row counts per tier and the database size."""
+        return await self._run(self._stats_sync)
+
+    def _stats_sync(self) -> dict[str, int]:
+        (raw,) = self._conn.execute("SELECT COUNT(*) FROM raw_executions").fetchone()
+        counts = dict(
+            self._conn.execute("SELECT resolution, COUNT(*) FROM rollups GROUP BY resolution")
+        )
+        (pages,) = self._conn.execute("PRAGMA page_count").fetchone()
+        (page_size,) = self._conn.execute("PRAGMA page_size").fetchone()
+        return {
+            "raw_records": raw,
+            "hourly_rollups": counts.get(Resolution.HOURLY.value, 0),
+            "daily_rollups": counts.get(Resolution.DAILY.value, 0),
+            "size_bytes": pages * page_size,
+        }
+
+    async def close(self) -> None:
+        """Close the database."""
+        await self._run(self._conn.close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,74 @@
+"""Unit tests for ploston-enterprise REST API routers."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from ploston_core.extensions import FeatureFlagRegistry, PluginRegistry
+
+from ploston_enterprise.api import PROBE_PREFIX, create_probe_router
+from ploston_enterprise.capabilities import EnterpriseCapabilitiesProvider
+from ploston_enterprise.lifecycle import ReadinessState
+from ploston_enterprise.plugins import DrainPlugin
+
+
+@pytest.fixture
+def readiness() -> ReadinessState:
+    return ReadinessState()
+
+
+@pytest.fixture
+def client(readiness) -> TestClient:
+    app = FastAPI()
+    app.include_router(create_probe_router(readiness), prefix=PROBE_PREFIX)
+    return TestClient(app)
+
+
+class TestProbeRouter:
+    """Test liveness and readiness probes."""
+
+    def test_live_while_warming(self, client, readiness):
+        """Test that liveness succeeds before the server is ready."""
+        readiness.start_warming()
+        response = client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json() == {"status": "alive", "phase": "warming"}
+
+    def test_not_ready_while_warming(self, client, readiness):
+        """Test that readiness fails until warm-up finishes."""
+        readiness.start_warming()
+        assert client.get("/health/ready").status_code == 503
+
+        readiness.mark_ready({"drain": "ok"})
+        response = client.get("/health/ready")
+        assert response.status_code == 200
+        assert response.json()["warm_up"] == {"drain": "ok"}
+
+    def test_not_ready_while_draining(self, client, readiness):
+        """Test that readiness fails once draining starts."""
+        readiness.mark_ready({})
+        readiness.start_draining()
+        response = client.get("/health/ready")
+        assert response.status_code == 503
+        assert response.json()["phase"] == "draining"
+
+
+class TestCapabilitiesPriming:
+    """Test capabilities caching."""
+
+    @pytest.fixture(autouse=True)
+    def registries(self):
+        FeatureFlagRegistry.reset()
+        PluginRegistry.reset()
+        yield
+        FeatureFlagRegistry.reset()
+        PluginRegistry.reset()
+
+    def test_primed_capabilities_are_reused(self):
+        """Test that primed capabilities are served without rebuilding."""
+        provider = EnterpriseCapabilitiesProvider("1.0.0")
+        assert provider.get_capabilities() is not provider.get_capabilities()
+
+        PluginRegistry.get().register(DrainPlugin())
+        primed = provider.prime()
+        assert provider.get_capabilities() is primed
+        assert provider.get_capabilities().version == "1.0.0"
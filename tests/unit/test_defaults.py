@@ -53,6 +53,7 @@ class TestEnterpriseFeatureFlags:
         assert "policy" in plugins
         assert "patterns" in plugins
         assert "synthesis" in plugins
+        assert "scheduler" in plugins
 
 
 class TestGetEnterpriseFeatureFlags:
@@ -0,0 +1,161 @@
+"""Unit tests for ploston-enterprise diagnostics mode."""
+
+import asyncio
+import gc
+import inspect
+import time
+import tracemalloc
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from ploston_core.extensions import PluginRegistry
+from ploston_core.invoker import ToolCallResult
+
+from ploston_enterprise.api import create_enterprise_router
+from ploston_enterprise.diagnostics import AllocationSampler, GCMonitor, LoopLagMonitor
+from ploston_enterprise.plugins import DiagnosticsPlugin, PatternsPlugin
+
+
+def _block_the_loop(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+class FakeInvoker:
+    """Tool invoker whose results are large."""
+
+    async def invoke(
+        self, tool_name, params, timeout_seconds=None, step_id=None, execution_id=None
+    ):
+        output = [bytes(1024) for _ in range(1000)]
+        return ToolCallResult(success=True, output=output, duration_ms=1, tool_name=tool_name)
+
+
+class TestLoopLagMonitor:
+    """Test event-loop lag measurement."""
+
+    async def test_reports_blocking_call_with_stack(self):
+        """Test that a blocking call is reported with the stack that blocked."""
+        monitor = LoopLagMonitor(interval=0.01, slow_callback_ms=50)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _block_the_loop(0.3)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        report = monitor.report()
+        [slow] = report["slow_callbacks"]
+        assert slow["blocked_ms"] >= 200
+        assert any("_block_the_loop" in line for line in slow["stack"])
+        assert report["lag"]["max_ms"] >= 200
+
+    async def test_idle_loop_has_no_slow_callbacks(self):
+        """Test that an idle loop reports samples but no slow callbacks."""
+        monitor = LoopLagMonitor(interval=0.01, slow_callback_ms=100)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        report = monitor.report()
+        assert report["lag"]["samples"] > 0
+        assert report["slow_callbacks"] == []
+
+
+class TestGCMonitor:
+    """Test garbage collection pause tracking."""
+
+    def test_records_collections(self):
+        """Test that collections are counted while started, and only then."""
+        monitor = GCMonitor()
+        monitor.start()
+        gc.collect()
+        monitor.stop()
+        gc.collect()
+
+        assert monitor.report()["gen2"]["collections"] == 1
+        assert monitor._callback not in gc.callbacks
+
+
+class TestAllocationSampler:
+    """Test per-plugin allocation sampling."""
+
+    def test_attributes_allocations_to_module(self):
+        """Test that allocations are grouped by the module that made them."""
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already enabled")
+        sampler = AllocationSampler()
+        sampler.start()
+        try:
+            retained = [bytes(1024) for _ in range(1000)]
+            report = sampler.sample({"tests": __file__, "other": "/nowhere.py"}, top=3)
+            again = sampler.sample({"tests": __file__}, top=3)
+        finally:
+            sampler.stop()
+
+        assert len(retained) == 1000
+        tests = report["plugins"]["tests"]
+        assert tests["size_bytes"] >= 1000 * 1024
+        assert tests["top"][0]["site"].startswith(__file__)
+        assert report["plugins"]["other"]["size_bytes"] == 0
+        assert abs(again["plugins"]["tests"]["growth_bytes"]) < tests["size_bytes"]
+        assert not tracemalloc.is_tracing()
+
+    async def test_ignores_excluded_code_called_by_plugin(self):
+        """Test that a plugin wrapping core calls is not charged for what core allocates."""
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already enabled")
+        invoker = FakeInvoker()
+        PatternsPlugin().observe_tool_calls(invoker)
+        modules = {"patterns": inspect.getfile(PatternsPlugin)}
+        # This file stands in for core, which the fake invoker belongs to
+        sampler = AllocationSampler(excluded_paths=[__file__])
+        sampler.start()
+        try:
+            result = await invoker.invoke("fetch", {"url": "https://example.com"})
+            report = sampler.sample(modules, top=3)
+        finally:
+            sampler.stop()
+
+        assert len(result.output) == 1000
+        assert report["plugins"]["patterns"]["size_bytes"] < 1000 * 1024
+
+
+class TestDiagnosticsPlugin:
+    """Test diagnostics lifecycle and endpoints."""
+
+    @pytest.fixture
+    def registry(self):
+        PluginRegistry.reset()
+        yield PluginRegistry.get()
+        PluginRegistry.reset()
+
+    async def test_shutdown_removes_all_instrumentation(self, registry):
+        """Test that nothing keeps running once the plugin is shut down."""
+        if tracemalloc.is_tracing():
+            pytest.skip("tracemalloc already enabled")
+        plugin = DiagnosticsPlugin()
+        registry.register(plugin)
+        callbacks = len(gc.callbacks)
+
+        await plugin.on_startup()
+        assert tracemalloc.is_tracing()
+        sample = await plugin.sample_allocations(top=1)
+        assert "diagnostics" in sample["plugins"]
+        await plugin.on_shutdown()
+
+        assert not tracemalloc.is_tracing()
+        assert len(gc.callbacks) == callbacks
+
+    def test_endpoints_only_when_enabled(self):
+        """Test that the admin endpoints exist only in diagnostics mode."""
+        app = FastAPI()
+        app.include_router(create_enterprise_router(diagnostics=DiagnosticsPlugin()))
+        response = TestClient(app).get("/admin/diagnostics")
+        assert response.status_code == 200
+        assert set(response.json()) == {"event_loop", "gc", "tracemalloc"}
+
+        app = FastAPI()
+        app.include_router(create_enterprise_router())
+        assert TestClient(app).get("/admin/diagnostics").status_code == 404
@@ -0,0 +1,148 @@
+"""Unit tests for ploston-enterprise workflow hook dispatch."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from ploston_core.extensions import AELPlugin, PluginRegistry
+
+from ploston_enterprise.hooks import install_workflow_hooks
+
+
+class FakeEngine:
+    """Workflow engine stub."""
+
+    def __init__(self, error: Exception | None = None, block: bool = False):
+        self.error = error
+        self.block = block
+        self.calls: list[str] = []
+        self.kwargs: dict[str, Any] = {}
+
+    async def execute(
+        self,
+        workflow_id: str,
+        inputs: dict[str, Any],
+        timeout_seconds: int | None = None,
+        bridge_session_id: str | None = None,
+        parent_execution_id: str | None = None,
+    ) -> dict:
+        self.calls.append(workflow_id)
+        self.kwargs = {
+            "timeout_seconds": timeout_seconds,
+            "bridge_session_id": bridge_session_id,
+            "parent_execution_id": parent_execution_id,
+        }
+        if self.block:
+            await asyncio.Event().wait()
+        if self.error:
+            raise self.error
+        return {"workflow_id": workflow_id, "status": "completed"}
+
+
+class RecordingPlugin(AELPlugin):
+    """Plugin that records hook calls."""
+
+    name = "recording"
+    tier = "enterprise"
+
+    def __init__(self, name: str, events: list, reject: bool = False):
+        self.name = name
+        self.events = events
+        self.reject = reject
+
+    async def on_workflow_start(self, workflow_id: str, context: dict[str, Any]) -> None:
+        self.events.append((self.name, "start", context["invocation_id"]))
+        if self.reject:
+            raise RuntimeError("rejected")
+
+    async def on_workflow_complete(
+        self, workflow_id: str, result: Any, context: dict[str, Any]
+    ) -> None:
+        self.events.append((self.name, "complete", context["invocation_id"]))
+
+    async def on_workflow_error(
+        self, workflow_id: str, error: Exception, context: dict[str, Any]
+    ) -> None:
+        self.events.append((self.name, "error", context["invocation_id"]))
+
+
+@pytest.fixture
+def registry():
+    PluginRegistry.reset()
+    yield PluginRegistry.get()
+    PluginRegistry.reset()
+
+
+class TestInstallWorkflowHooks:
+    """Test hook dispatch around engine executions."""
+
+    async def test_passes_engine_arguments_through(self, registry):
+        """Test that arguments added by newer core versions reach the engine."""
+        engine = FakeEngine()
+        install_workflow_hooks(engine, registry)
+
+        await engine.execute("wf", {}, 30, bridge_session_id="s-1", parent_execution_id="e-1")
+
+        assert engine.kwargs == {
+            "timeout_seconds": 30,
+            "bridge_session_id": "s-1",
+            "parent_execution_id": "e-1",
+        }
+
+    async def test_dispatches_start_and_complete(self, registry):
+        """Test that plugins see the start and completion of an execution."""
+        events: list = []
+        registry.register(RecordingPlugin("a", events))
+        registry.register(RecordingPlugin("b", events))
+        engine = FakeEngine()
+        install_workflow_hooks(engine, registry)
+
+        result = await engine.execute("wf", {})
+
+        assert result["status"] == "completed"
+        assert [e[:2] for e in events] == [
+            ("a", "start"),
+            ("b", "start"),
+            ("b", "complete"),
+            ("a", "complete"),
+        ]
+        assert len({e[2] for e in events}) == 1
+
+    async def test_dispatches_error(self, registry):
+        """Test that execution errors reach plugins and are re-raised."""
+        events: list = []
+        registry.register(RecordingPlugin("a", events))
+        engine = FakeEngine(error=ValueError("boom"))
+        install_workflow_hooks(engine, registry)
+
+        with pytest.raises(ValueError):
+            await engine.execute("wf", {})
+        assert [e[:2] for e in events] == [("a", "start"), ("a", "error")]
+
+    async def test_rejection_unwinds_started_plugins(self, registry):
+        """Test that a rejecting plugin stops execution and notifies earlier plugins."""
+        events: list = []
+        registry.register(RecordingPlugin("a", events))
+        registry.register(RecordingPlugin("gate", events, reject=True))
+        registry.register(RecordingPlugin("c", events))
+        engine = FakeEngine()
+        install_workflow_hooks(engine, registry)
+
+        with pytest.raises(RuntimeError):
+            await engine.execute("wf", {})
+        assert engine.calls == []
+        assert [e[:2] for e in events] == [("a", "start"), ("gate", "start"), ("a", "error")]
+
+    async def test_dispatches_error_on_cancellation(self, registry):
+        """Test that cancelled executions reach plugins as errors."""
+        events: list = []
+        registry.register(RecordingPlugin("a", events))
+        engine = FakeEngine(block=True)
+        install_workflow_hooks(engine, registry)
+
+        task = asyncio.create_task(engine.execute("wf", {}))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert [e[:2] for e in events] == [("a", "start"), ("a", "error")]
@@ -0,0 +1,209 @@
+"""Unit tests for ploston-enterprise lifecycle module."""
+
+import asyncio
+
+import pytest
+from ploston_core.extensions import PluginRegistry
+
+from ploston_enterprise.hooks import install_workflow_hooks
+from ploston_enterprise.lifecycle import (
+    ExecutionTracker,
+    ReadinessState,
+    ServerDrainingError,
+    ServerPhase,
+    shutdown_plugins,
+    startup_plugins,
+)
+from ploston_enterprise.plugins import DrainPlugin
+
+
+class FakePlugin:
+    """Plugin stub with a configurable shutdown."""
+
+    def __init__(self, name: str, delay: float = 0.0, error: Exception | None = None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.started = False
+        self.shut_down = False
+
+    async def on_startup(self) -> None:
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.started = True
+
+    async def on_shutdown(self) -> None:
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        self.shut_down = True
+
+
+class TestReadinessState:
+    """Test readiness phases."""
+
+    def test_ready_only_after_warm_up(self):
+        """Test that the server is not ready while starting or warming."""
+        readiness = ReadinessState()
+        assert readiness.phase == ServerPhase.STARTING
+        readiness.start_warming()
+        assert not readiness.ready
+
+        readiness.mark_ready({"patterns": "ok"})
+        assert readiness.ready
+        assert readiness.to_dict() == {"phase": "ready", "warm_up": {"patterns": "ok"}}
+
+    def test_draining_is_not_ready(self):
+        """Test that warm-up finishing during a drain keeps the server out."""
+        readiness = ReadinessState()
+        readiness.start_warming()
+        readiness.start_draining()
+        readiness.mark_ready({})
+        assert readiness.phase == ServerPhase.DRAINING
+        assert not readiness.ready
+
+
+class TestExecutionTracker:
+    """Test in-flight execution tracking."""
+
+    def test_tracks_in_flight(self):
+        """Test that acquire and release are counted per execution."""
+        tracker = ExecutionTracker()
+        tracker.acquire("wf")
+        tracker.acquire("wf")
+        tracker.acquire("other")
+        assert tracker.in_flight == 3
+
+        tracker.release("wf")
+        tracker.release("other")
+        assert tracker.in_flight == 1
+
+    def test_rejects_while_draining(self):
+        """Test that new executions are rejected once draining starts."""
+        tracker = ExecutionTracker()
+        tracker.start_draining()
+        with pytest.raises(ServerDrainingError) as exc_info:
+            tracker.acquire("wf")
+        assert exc_info.value.code == "SERVER_DRAINING"
+
+    async def test_wait_idle_returns_when_executions_finish(self):
+        """Test that draining completes as soon as the last execution ends."""
+        tracker = ExecutionTracker()
+        tracker.acquire("wf")
+        tracker.start_draining()
+
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.01, tracker.release, "wf")
+        assert await tracker.wait_idle(timeout=1.0) is True
+
+    async def test_wait_idle_times_out(self):
+        """Test that draining gives up at the deadline."""
+        tracker = ExecutionTracker()
+        tracker.acquire("wf")
+        assert await tracker.wait_idle(timeout=0.01) is False
+
+    async def test_wait_idle_when_nothing_running(self):
+        """Test that an idle tracker drains immediately."""
+        assert await ExecutionTracker().wait_idle(timeout=0) is True
+
+
+class TestShutdownPlugins:
+    """Test parallel plugin shutdown."""
+
+    async def test_shuts_down_plugins_concurrently(self):
+        """Test that plugins flush in parallel rather than one after another."""
+        plugins = [FakePlugin(f"p{i}", delay=0.05) for i in range(5)]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        outcomes = await shutdown_plugins(plugins, timeout=1.0)
+
+        assert loop.time() - start < 0.2
+        assert outcomes == {f"p{i}": "ok" for i in range(5)}
+        assert all(p.shut_down for p in plugins)
+
+    async def test_per_plugin_timeout_and_errors(self):
+        """Test that slow or failing plugins do not affect the others."""
+        plugins = [
+            FakePlugin("slow", delay=10),
+            FakePlugin("broken", error=RuntimeError("boom")),
+            FakePlugin("ok"),
+        ]
+        outcomes = await shutdown_plugins(plugins, timeout=0.01)
+
+        assert outcomes == {"slow": "timeout", "broken": "error: boom", "ok": "ok"}
+
+
+class TestStartupPlugins:
+    """Test parallel plugin warm-up."""
+
+    async def test_starts_plugins_concurrently(self):
+        """Test that warm-up takes as long as the slowest plugin."""
+        plugins = [FakePlugin(f"p{i}", delay=0.05) for i in range(5)]
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        outcomes = await startup_plugins(plugins, timeout=1.0)
+
+        assert loop.time() - start < 0.2
+        assert outcomes == {f"p{i}": "ok" for i in range(5)}
+        assert all(p.started for p in plugins)
+
+    async def test_per_plugin_timeout_and_errors(self):
+        """Test that slow or failing plugins are reported individually."""
+        plugins = [
+            FakePlugin("slow", delay=10),
+            FakePlugin("broken", error=RuntimeError("boom")),
+            FakePlugin("ok"),
+        ]
+        outcomes = await startup_plugins(plugins, timeout=0.01)
+
+        assert outcomes == {"slow": "timeout", "broken": "error: boom", "ok": "ok"}
+
+
+class TestDrainPlugin:
+    """Test execution tracking through workflow hooks."""
+
+    @pytest.fixture
+    def registry(self):
+        PluginRegistry.reset()
+        yield PluginRegistry.get()
+        PluginRegistry.reset()
+
+    async def test_tracks_successful_and_failed_executions(self, registry):
+        """Test that executions are released whether they succeed or fail."""
+        drain = DrainPlugin()
+        registry.register(drain)
+
+        class Engine:
+            async def execute(self, workflow_id, inputs, timeout_seconds=None):
+                assert drain.tracker.in_flight == 1
+                if inputs.get("fail"):
+                    raise RuntimeError("step failed")
+                return "done"
+
+        engine = Engine()
+        install_workflow_hooks(engine, registry)
+
+        assert await engine.execute("wf", {}) == "done"
+        with pytest.raises(RuntimeError):
+            await engine.execute("wf", {"fail": True})
+        assert drain.tracker.in_flight == 0
+
+    async def test_rejects_executions_while_draining(self, registry):
+        """Test that new executions fail once draining starts."""
+        drain = DrainPlugin()
+        registry.register(drain)
+
+        class Engine:
+            async def execute(self, workflow_id, inputs, timeout_seconds=None):
+                return "done"
+
+        engine = Engine()
+        install_workflow_hooks(engine, registry)
+        drain.tracker.start_draining()
+
+        with pytest.raises(ServerDrainingError):
+            await engine.execute("wf", {})
+        assert drain.tracker.in_flight == 0
@@ -0,0 +1,202 @@
+"""Unit tests for ploston-enterprise parallelizable-step detection."""
+
+from datetime import datetime
+
+from ploston_enterprise.patterns import ExecutionStore, ParallelismAnalyzer
+
+
+def _result(steps: list[dict], status: str = "completed") -> dict:
+    return {"status": status, "steps": steps}
+
+
+def _fan_out_result(user_id: int) -> dict:
+    """fetch_user and fetch_orders are independent; summarize uses both."""
+    user = {"id": user_id, "name": f"user-{user_id}"}
+    orders = [{"order": user_id * 10}]
+    return _result(
+        [
+            {
+                "id": "fetch_user",
+                "tool": "users_get",
+                "inputs": {"user_id": user_id},
+                "output": user,
+                "duration_ms": 100,
+            },
+            {
+                "id": "fetch_orders",
+                "tool": "orders_list",
+                "inputs": {"user_id": user_id},
+                "output": orders,
+                "duration_ms": 300,
+            },
+            {
+                "id": "summarize",
+                "tool": "summarize",
+                "inputs": {"user": user, "orders": orders},
+                "output": "summary",
+                "duration_ms": 50,
+            },
+        ]
+    )
+
+
+def _store_with(workflow_id: str, results: list[dict]) -> ExecutionStore:
+    store = ExecutionStore()
+    for result in results:
+        store.record(workflow_id, result)
+    return store
+
+
+class TestExecutionStore:
+    """Test the execution history store."""
+
+    def test_ignores_results_without_steps(self):
+        """Test that results without steps are not recorded."""
+        store = ExecutionStore()
+        assert store.record("wf", {"status": "completed"}) is None
+        assert store.workflow_ids() == []
+
+    def test_bounds_history_per_workflow(self):
+        """Test that only the most recent executions are kept."""
+        store = ExecutionStore(max_executions_per_workflow=2)
+        for i in range(5):
+            store.record("wf", _fan_out_result(i))
+        executions = store.executions("wf")
+        assert len(executions) == 2
+        assert executions[-1].steps[0].inputs == {"user_id": 4}
+
+
+class TestParallelismAnalyzer:
+    """Test the parallelism analyzer."""
+
+    def test_recommends_independent_steps(self):
+        """Test that steps without data flow are grouped."""
+        store = _store_with("wf", [_fan_out_result(i) for i in range(3)])
+        rec = ParallelismAnalyzer().analyze("wf", store.executions("wf"))
+
+        assert rec is not None
+        assert [g.step_ids for g in rec.groups] == [["fetch_user", "fetch_orders"]]
+        assert rec.groups[0].estimated_saving_ms == 100
+        assert rec.sequential_ms == 450
+        assert rec.parallel_ms == 350
+        assert rec.estimated_saving_ms == 100
+        assert rec.dependencies["summarize"] == ["fetch_orders", "fetch_user"]
+
+    def test_requires_minimum_history(self):
+        """Test that no recommendation is made from too few executions."""
+        store = _store_with("wf", [_fan_out_result(i) for i in range(2)])
+        assert ParallelismAnalyzer(min_executions=3).analyze("wf", store.executions("wf")) is None
+
+    def test_ignores_failed_executions(self):
+        """Test that failed executions do not count toward history."""
+        results = [_fan_out_result(i) for i in range(3)]
+        results[0]["status"] = "failed"
+        store = _store_with("wf", results)
+        assert ParallelismAnalyzer().analyze("wf", store.executions("wf")) is None
+
+    def test_template_reference_is_dependency(self):
+        """Test that template references create dependencies."""
+        steps = [
+            {"id": "a", "inputs": {"q": "x"}, "output": "1", "duration_ms": 10},
+            {"id": "b", "inputs": {"q": "{{ steps.a.output }}"}, "output": "2", "duration_ms": 10},
+        ]
+        store = _store_with("wf", [_result(steps)] * 3)
+        assert ParallelismAnalyzer().analyze("wf", store.executions("wf")) is None
+
+    def test_dynamic_step_lookup_in_code_depends_on_all_earlier_steps(self):
+        """Test that code reading steps other than by literal lookup is not parallelized."""
+        steps = [
+            {"id": "fetch", "tool": "http_get", "inputs": {"url": "x"}, "duration_ms": 100},
+            {
+                "id": "parse",
+                "inputs": {"code": "d = context.steps.get('fetch').output\nreturn d"},
+                "duration_ms": 100,
+            },
+        ]
+        store = _store_with("wf", [_result(steps)] * 3)
+        analyzer = ParallelismAnalyzer()
+        assert analyzer.dependencies(store.executions("wf"))["parse"] == {"fetch"}
+        assert analyzer.analyze("wf", store.executions("wf")) is None
+
+    def test_dependency_seen_once_is_kept(self):
+        """Test that data flow observed in any execution blocks parallelism."""
+        independent = [
+            {"id": "a", "inputs": {"q": 1}, "output": {"v": 1}, "duration_ms": 10},
+            {"id": "b", "inputs": {"q": 2}, "output": {"v": 2}, "duration_ms": 10},
+        ]
+        dependent = [
+            {"id": "a", "inputs": {"q": 1}, "output": {"v": 3}, "duration_ms": 10},
+            {"id": "b", "inputs": {"prev": {"v": 3}}, "output": {"v": 4}, "duration_ms": 10},
+        ]
+        store = _store_with("wf", [_result(independent)] * 2 + [_result(dependent)])
+        assert ParallelismAnalyzer().analyze("wf", store.executions("wf")) is None
+
+    def test_explicit_depends_on(self):
+        """Test that declared dependencies are honored."""
+        steps = [
+            {"id": "a", "inputs": {}, "output": "x", "duration_ms": 10},
+            {"id": "b", "inputs": {}, "output": "y", "duration_ms": 10, "depends_on": ["a"]},
+        ]
+        store = _store_with("wf", [_result(steps)] * 3)
+        assert ParallelismAnalyzer().analyze("wf", store.executions("wf")) is None
+
+    def test_uses_median_duration(self):
+        """Test that savings use median step durations."""
+        results = []
+        for duration in (100, 200, 10_000):
+            results.append(
+                _result(
+                    [
+                        {"id": "a", "inputs": {"n": 1}, "output": "aaa", "duration_ms": duration},
+                        {"id": "b", "inputs": {"n": 2}, "output": "bbb", "duration_ms": 150},
+                    ]
+                )
+            )
+        store = _store_with("wf", results)
+        rec = ParallelismAnalyzer().analyze("wf", store.executions("wf"))
+        assert rec is not None
+        assert rec.estimated_saving_ms == 150
+
+
+class TestPatternsPlugin:
+    """Test recording of engine execution results."""
+
+    async def test_records_execution_results_with_definitions(self):
+        """Test that step definitions supply tools and dependencies."""
+        from ploston_core.engine.types import ExecutionResult, StepResult
+        from ploston_core.types import ExecutionStatus, StepStatus
+        from ploston_core.workflow.types import StepDefinition
+
+        from ploston_enterprise.plugins import PatternsPlugin
+
+        class FakeWorkflow:
+            steps = [
+                StepDefinition(id="a", tool="fetch_a", params={"q": "{{ inputs.q }}"}),
+                StepDefinition(id="b", tool="fetch_b", params={"q": "{{ inputs.q }}"}),
+                StepDefinition(id="c", code='return steps["a"].output + steps["b"].output'),
+            ]
+
+        class FakeRegistry:
+            def get(self, name):
+                return FakeWorkflow() if name == "wf" else None
+
+        plugin = PatternsPlugin(workflow_registry=FakeRegistry())
+        for _ in range(3):
+            result = ExecutionResult(
+                execution_id="exec-1",
+                workflow_id="wf",
+                workflow_version="1",
+                status=ExecutionStatus.COMPLETED,
+                started_at=datetime.now(),
+                steps=[
+                    StepResult(step_id="a", status=StepStatus.COMPLETED, duration_ms=40, output=1),
+                    StepResult(step_id="b", status=StepStatus.COMPLETED, duration_ms=60, output=2),
+                    StepResult(step_id="c", status=StepStatus.COMPLETED, duration_ms=5, output=3),
+                ],
+            )
+            await plugin.on_workflow_complete("wf", result, {})
+
+        [rec] = plugin.get_parallel_recommendations()
+        assert [g.step_ids for g in rec.groups] == [["a", "b"]]
+        assert rec.dependencies["c"] == ["a", "b"]
+        assert rec.estimated_saving_ms == 40
@@ -0,0 +1,198 @@
+"""Unit tests for ploston-enterprise policy evaluation."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ploston_enterprise.api import MAX_POLICY_BATCH, create_enterprise_router
+from ploston_enterprise.plugins import PolicyPlugin
+from ploston_enterprise.policy import (
+    EvaluationRequest,
+    PolicyEngine,
+    PolicyError,
+    PolicyRule,
+    Principal,
+    PrincipalDirectory,
+)
+
+POLICY_YAML = """
+principals:
+  alice:
+    roles: [admin]
+  bob:
+    roles: [analyst]
+    attributes:
+      team: data
+rules:
+  - id: admins
+    roles: [admin]
+  - id: data-tools
+    actions: ["tool:call"]
+    resources: ["tool:warehouse_*"]
+    conditions:
+      principal.team: data
+  - id: no-prod-writes
+    effect: deny
+    actions: ["tool:call"]
+    resources: ["tool:warehouse_write"]
+    conditions:
+      env: [prod, staging]
+"""
+
+
+class CountingDirectory(PrincipalDirectory):
+    """Directory that counts lookups."""
+
+    def __init__(self, principals):
+        super().__init__(principals)
+        self.lookups: list[str] = []
+
+    def get(self, principal_id: str) -> Principal:
+        self.lookups.append(principal_id)
+        return super().get(principal_id)
+
+
+@pytest.fixture
+def engine(tmp_path) -> PolicyEngine:
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY_YAML)
+    return PolicyEngine.from_file(str(path))
+
+
+def _request(principal: str, resource: str, action: str = "tool:call", **attributes):
+    return EvaluationRequest(
+        principal=principal, resource=resource, action=action, attributes=attributes
+    )
+
+
+class TestPolicyEngine:
+    """Test rule evaluation."""
+
+    def test_role_rule(self, engine):
+        """Test that role rules allow any action and resource they match."""
+        decision = engine.evaluate(_request("alice", "workflow:deploy", "workflow:execute"))
+        assert decision.allowed
+        assert decision.rule == "admins"
+
+    def test_default_deny(self, engine):
+        """Test that requests matching no rule are denied."""
+        decision = engine.evaluate(_request("mallory", "tool:warehouse_read"))
+        assert not decision.allowed
+        assert decision.rule is None
+
+    def test_principal_attribute_condition(self, engine):
+        """Test that conditions on principal attributes are honored."""
+        assert engine.evaluate(_request("bob", "tool:warehouse_read")).allowed
+        assert not engine.evaluate(_request("bob", "tool:billing_read")).allowed
+
+    def test_deny_overrides_allow(self, engine):
+        """Test that matching deny rules win over allow rules."""
+        decision = engine.evaluate(_request("alice", "tool:warehouse_write", env="prod"))
+        assert not decision.allowed
+        assert decision.rule == "no-prod-writes"
+        assert engine.evaluate(_request("alice", "tool:warehouse_write", env="dev")).allowed
+
+    def test_invalid_effect(self):
+        """Test that rules with unknown effects are rejected."""
+        with pytest.raises(PolicyError):
+            PolicyRule(id="r", effect="maybe")
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing policy file raises PolicyError."""
+        with pytest.raises(PolicyError) as exc:
+            PolicyEngine.from_file(str(tmp_path / "missing.yaml"))
+        assert exc.value.code == "FILE_NOT_FOUND"
+
+    def test_invalid_file(self, tmp_path):
+        """Test that malformed rules raise PolicyError."""
+        path = tmp_path / "policy.yaml"
+        path.write_text("rules:\n  - effect: allow\n")
+        with pytest.raises(PolicyError) as exc:
+            PolicyEngine.from_file(str(path))
+        assert exc.value.code == "INVALID_POLICY"
+
+
+class TestBatchEvaluation:
+    """Test batch policy evaluation."""
+
+    def test_matches_single_evaluation(self, engine):
+        """Test that batch results equal one-by-one evaluation, in order."""
+        requests = [
+            _request("alice", "tool:warehouse_write", env="prod"),
+            _request("bob", "tool:warehouse_read"),
+            _request("mallory", "tool:warehouse_read"),
+        ]
+        assert engine.evaluate_batch(requests) == [engine.evaluate(r) for r in requests]
+
+    def test_reuses_principal_lookups(self):
+        """Test that each principal is resolved once per batch."""
+        directory = CountingDirectory([Principal("bob", roles=["analyst"])])
+        engine = PolicyEngine(
+            rules=[PolicyRule(id="analysts", effect="allow", roles=["analyst"])],
+            directory=directory,
+        )
+        requests = [_request("bob", f"tool:t{i}") for i in range(20)]
+        requests += [_request("eve", "tool:t0"), _request("eve", "tool:t1")]
+
+        decisions = engine.evaluate_batch(requests)
+
+        assert sorted(directory.lookups) == ["bob", "eve"]
+        assert [d.allowed for d in decisions] == [True] * 20 + [False] * 2
+
+
+class TestPolicyPlugin:
+    """Test workflow execution checks."""
+
+    async def test_denies_unauthorized_principal(self, engine):
+        """Test that executions by unauthorized principals are rejected."""
+        plugin = PolicyPlugin(engine=engine)
+        await plugin.on_startup()
+
+        await plugin.on_workflow_start("deploy", {"principal": "alice"})
+        with pytest.raises(PolicyError) as exc:
+            await plugin.on_workflow_start("deploy", {"principal": "bob"})
+        assert exc.value.code == "POLICY_DENIED"
+
+    async def test_skips_executions_without_principal(self, engine):
+        """Test that anonymous executions are not checked."""
+        await PolicyPlugin(engine=engine).on_workflow_start("deploy", {})
+
+
+class TestPolicyEndpoint:
+    """Test the batch evaluation endpoint."""
+
+    @pytest.fixture
+    def client(self, engine) -> TestClient:
+        app = FastAPI()
+        app.include_router(create_enterprise_router(policy=PolicyPlugin(engine=engine)))
+        return TestClient(app)
+
+    def test_returns_compact_arrays(self, client):
+        """Test that decisions come back as parallel arrays in request order."""
+        response = client.post(
+            "/policy/evaluate",
+            json={
+                "requests": [
+                    {"principal": "bob", "resource": "tool:warehouse_read", "action": "tool:call"},
+                    {
+                        "principal": "alice",
+                        "resource": "tool:warehouse_write",
+                        "action": "tool:call",
+                        "attributes": {"env": "prod"},
+                    },
+                ]
+            },
+        )
+        assert response.status_code == 200
+        assert response.json() == {
+            "allowed": [True, False],
+            "rules": ["data-tools", "no-prod-writes"],
+        }
+
+    def test_rejects_oversized_batch(self, client):
+        """Test that batches above the limit are rejected."""
+        item = {"principal": "bob", "resource": "tool:x", "action": "tool:call"}
+        response = client.post(
+            "/policy/evaluate", json={"requests": [item] * (MAX_POLICY_BATCH + 1)}
+        )
+        assert response.status_code == 422
@@ -0,0 +1,272 @@
+"""Unit tests for ploston-enterprise execution scheduler."""
+
+import asyncio
+
+import pytest
+from ploston_core.extensions import PluginRegistry
+
+from ploston_enterprise.hooks import install_workflow_hooks
+from ploston_enterprise.plugins import SchedulerPlugin
+from ploston_enterprise.scheduling import (
+    PriorityClass,
+    QueueWaitHistogram,
+    SchedulerError,
+    SeatMiddleware,
+    WeightedFairScheduler,
+    current_seat,
+    seat_for_scope,
+)
+
+CLASSES = [PriorityClass("interactive", 4), PriorityClass("batch", 1)]
+
+
+async def _settle() -> None:
+    """Let woken waiters run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestPriorityClass:
+    """Test priority class parsing."""
+
+    def test_parse(self):
+        """Test that name:weight lists are parsed in order."""
+        assert PriorityClass.parse("interactive:8, batch:1,bulk") == [
+            PriorityClass("interactive", 8),
+            PriorityClass("batch", 1),
+            PriorityClass("bulk", 1),
+        ]
+
+    def test_rejects_non_positive_weight(self):
+        """Test that zero weights are rejected."""
+        with pytest.raises(ValueError):
+            PriorityClass.parse("batch:0")
+
+
+class TestQueueWaitHistogram:
+    """Test queue-wait histogram."""
+
+    def test_observe_and_quantiles(self):
+        """Test that observations land in cumulative buckets."""
+        histogram = QueueWaitHistogram(bounds_ms=(10.0, 100.0))
+        for wait in (1, 5, 50, 500):
+            histogram.observe(wait)
+
+        data = histogram.to_dict()
+        assert [b["count"] for b in data["buckets"]] == [2, 3, 4]
+        assert data["p50_ms"] == 10.0
+        assert data["p99_ms"] is None
+        assert data["sum_ms"] == 556
+
+
+class TestWeightedFairScheduler:
+    """Test weighted fair slot admission."""
+
+    def test_requires_classes(self):
+        """Test that a scheduler without classes is rejected."""
+        with pytest.raises(SchedulerError):
+            WeightedFairScheduler(max_concurrent=1, classes=[])
+
+    async def test_runs_immediately_when_slots_free(self):
+        """Test that executions are admitted without queueing below the limit."""
+        scheduler = WeightedFairScheduler(max_concurrent=2, classes=CLASSES)
+        assert await scheduler.acquire("batch") == "batch"
+        assert await scheduler.acquire("unknown") == "batch"
+        assert scheduler.running == 2
+        assert scheduler.stats()["classes"]["batch"]["queue_wait"]["count"] == 2
+
+    async def test_interactive_runs_ahead_of_queued_batch(self):
+        """Test that later interactive work overtakes a batch backlog."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        await scheduler.acquire("batch")
+
+        order = []
+
+        async def run(name: str, priority: str):
+            granted = await scheduler.acquire(priority)
+            order.append(name)
+            scheduler.release(granted)
+
+        tasks = [asyncio.create_task(run(f"batch-{i}", "batch")) for i in range(3)]
+        await _settle()
+        tasks.append(asyncio.create_task(run("interactive", "interactive")))
+        await _settle()
+
+        scheduler.release("batch")
+        await asyncio.gather(*tasks)
+        assert order[0] == "interactive"
+        assert scheduler.running == 0
+
+    async def test_slots_shared_by_weight(self):
+        """Test that backlogged classes are served in proportion to their weights."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        await scheduler.acquire("batch")
+
+        order = []
+
+        async def run(priority: str):
+            granted = await scheduler.acquire(priority)
+            order.append(priority)
+            scheduler.release(granted)
+
+        tasks = [asyncio.create_task(run(p)) for p in ["batch"] * 10 + ["interactive"] * 10]
+        await _settle()
+        scheduler.release("batch")
+        await asyncio.gather(*tasks)
+
+        assert order[:10].count("interactive") == 8
+        assert order[:10].count("batch") == 2
+
+    async def test_seats_served_round_robin(self):
+        """Test that one seat's backlog does not starve another seat."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        await scheduler.acquire("batch")
+
+        order = []
+
+        async def run(seat: str):
+            granted = await scheduler.acquire("batch", seat=seat)
+            order.append(seat)
+            scheduler.release(granted)
+
+        tasks = [asyncio.create_task(run("a")) for _ in range(3)]
+        tasks.append(asyncio.create_task(run("b")))
+        await _settle()
+        scheduler.release("batch")
+        await asyncio.gather(*tasks)
+
+        assert order[:2] == ["a", "b"]
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Test that cancelling a queued execution frees its place."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        await scheduler.acquire("batch")
+
+        waiting = asyncio.create_task(scheduler.acquire("batch"))
+        await _settle()
+        waiting.cancel()
+        await asyncio.gather(waiting, return_exceptions=True)
+
+        assert scheduler.queued == 0
+        scheduler.release("batch")
+        assert scheduler.running == 0
+
+    async def test_records_queue_wait(self):
+        """Test that queue waits are measured per class."""
+        now = [0.0]
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES, clock=lambda: now[0])
+        await scheduler.acquire("batch")
+        waiting = asyncio.create_task(scheduler.acquire("interactive"))
+        await _settle()
+
+        now[0] = 0.2
+        scheduler.release("batch")
+        await waiting
+
+        histogram = scheduler.stats()["classes"]["interactive"]["queue_wait"]
+        assert histogram["count"] == 1
+        assert histogram["sum_ms"] == pytest.approx(200)
+
+
+class TestSchedulerPlugin:
+    """Test scheduling through workflow hooks."""
+
+    @pytest.fixture
+    def registry(self):
+        PluginRegistry.reset()
+        yield PluginRegistry.get()
+        PluginRegistry.reset()
+
+    async def test_limits_concurrency_and_uses_workflow_classes(self, registry):
+        """Test that executions queue once all slots are taken."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        plugin = SchedulerPlugin(scheduler, workflow_classes={"nightly": "batch"})
+        registry.register(plugin)
+
+        release = asyncio.Event()
+        seen = []
+
+        class Engine:
+            async def execute(self, workflow_id, inputs, timeout_seconds=None):
+                seen.append(workflow_id)
+                await release.wait()
+                if workflow_id == "broken":
+                    raise RuntimeError("boom")
+                return workflow_id
+
+        engine = Engine()
+        install_workflow_hooks(engine, registry)
+
+        first = asyncio.create_task(engine.execute("nightly", {}))
+        second = asyncio.create_task(engine.execute("broken", {}))
+        await _settle()
+        assert seen == ["nightly"]
+        assert scheduler.queued == 1
+
+        release.set()
+        assert await first == "nightly"
+        with pytest.raises(RuntimeError):
+            await second
+        assert scheduler.running == 0
+        stats = scheduler.stats()["classes"]
+        assert stats["batch"]["queue_wait"]["count"] == 2
+        assert stats["interactive"]["queue_wait"]["count"] == 0
+
+    async def test_seat_taken_from_http_caller(self, registry):
+        """Test that executions started by a request queue under the caller's seat."""
+        scheduler = WeightedFairScheduler(max_concurrent=1, classes=CLASSES)
+        registry.register(SchedulerPlugin(scheduler))
+        seats = []
+        acquire = scheduler.acquire
+
+        async def recording_acquire(priority_class, seat="default"):
+            seats.append(seat)
+            return await acquire(priority_class, seat=seat)
+
+        scheduler.acquire = recording_acquire
+
+        class Engine:
+            async def execute(self, workflow_id, inputs, timeout_seconds=None):
+                return workflow_id
+
+        engine = Engine()
+        install_workflow_hooks(engine, registry)
+
+        async def app(scope, receive, send):
+            await engine.execute("wf", {})
+
+        scope = {"type": "http", "headers": [(b"x-api-key", b"secret-key-1")], "client": None}
+        await SeatMiddleware(app)(scope, None, None)
+        await engine.execute("wf", {})
+
+        assert seats == ["key:secret-k", "default"]
+
+
+class TestSeats:
+    """Test caller identification."""
+
+    def test_seat_for_scope(self):
+        """Test that API keys win over forwarded and direct client addresses."""
+        client = ("10.0.0.1", 5000)
+        assert seat_for_scope({"headers": [(b"x-api-key", b"abcdefghij")]}) == "key:abcdefgh"
+        assert (
+            seat_for_scope(
+                {"headers": [(b"x-forwarded-for", b"1.2.3.4, 10.0.0.9")], "client": client}
+            )
+            == "ip:1.2.3.4"
+        )
+        assert seat_for_scope({"headers": [], "client": client}) == "ip:10.0.0.1"
+
+    async def test_middleware_scopes_seat_to_request(self):
+        """Test that the seat is only visible while the request is handled."""
+        seen = []
+
+        async def app(scope, receive, send):
+            seen.append(current_seat())
+
+        await SeatMiddleware(app)(
+            {"type": "http", "headers": [], "client": ("1.2.3.4", 1)}, None, None
+        )
+
+        assert seen == ["ip:1.2.3.4"]
+        assert current_seat() is None
@@ -0,0 +1,175 @@
+"""Unit tests for ploston-enterprise server shutdown."""
+
+import asyncio
+import os
+import signal
+import socket
+import uuid
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from ploston_core.config import MCPHTTPConfig
+
+from ploston_enterprise.api import PROBE_PREFIX, create_probe_router
+from ploston_enterprise.lifecycle import ReadinessState, ServerDrainingError
+from ploston_enterprise.plugins import DiagnosticsPlugin, DrainPlugin
+from ploston_enterprise.server import (
+    EnterprisePlugins,
+    _create_http_server,
+    _ManagedServer,
+    _serve,
+)
+
+
+def find_free_port() -> int:
+    """Find a free port to use for testing."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class FakeFrontend:
+    """MCP frontend stub in MCP-only mode."""
+
+    def __init__(self):
+        self._http_config = MCPHTTPConfig(host="127.0.0.1", port=find_free_port())
+        self._rest_app = None
+        self._rest_prefix = "/api/v1"
+        self._http_transport = None
+        self._running = False
+
+    async def _handle_message(self, message: dict) -> dict:
+        return {"jsonrpc": "2.0", "id": message.get("id"), "result": {}}
+
+
+class FakeApp:
+    """PlostApplication stub."""
+
+    def __init__(self):
+        self.shut_down = False
+        self.mcp_frontend = FakeFrontend()
+
+    async def shutdown(self) -> None:
+        self.shut_down = True
+
+
+def create_http_app(drain: DrainPlugin, readiness: ReadinessState, release: asyncio.Event):
+    """Create an app whose executions run until ``release`` is set."""
+    http_app = FastAPI()
+    http_app.include_router(create_probe_router(readiness), prefix=PROBE_PREFIX)
+
+    @http_app.post("/run")
+    async def run() -> JSONResponse:
+        context = {"invocation_id": uuid.uuid4().hex}
+        try:
+            await drain.on_workflow_start("wf", context)
+        except ServerDrainingError as e:
+            return JSONResponse({"code": e.code}, status_code=503)
+        await release.wait()
+        await drain.on_workflow_complete("wf", {}, context)
+        return JSONResponse({"status": "completed"})
+
+    return http_app
+
+
+async def wait_for(condition, timeout: float = 5.0) -> None:
+    """Poll until a condition holds."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestServe:
+    """Test signal-driven shutdown of a served app."""
+
+    async def test_sigterm_drains_before_closing_listener(self, capsys):
+        """Test that SIGTERM keeps serving until in-flight executions finish."""
+        port = find_free_port()
+        url = f"http://127.0.0.1:{port}"
+        readiness = ReadinessState()
+        plugins = EnterprisePlugins(drain=DrainPlugin())
+        release = asyncio.Event()
+        http_server = _ManagedServer(
+            uvicorn.Config(
+                create_http_app(plugins.drain, readiness, release),
+                host="127.0.0.1",
+                port=port,
+                log_level="warning",
+            )
+        )
+        app = FakeApp()
+        server = asyncio.create_task(
+            _serve(
+                app,
+                plugins,
+                readiness,
+                http_server,
+                warmup_timeout=1,
+                drain_timeout=10,
+                plugin_timeout=1,
+            )
+        )
+
+        # Probes and new executions use fresh connections, as a load balancer would
+        def client() -> httpx.AsyncClient:
+            return httpx.AsyncClient(base_url=url, timeout=5)
+
+        await wait_for(lambda: http_server.started and readiness.ready)
+        async with client() as in_flight_client:
+            in_flight = asyncio.create_task(in_flight_client.post("/run"))
+            await wait_for(lambda: plugins.drain.tracker.in_flight == 1)
+
+            os.kill(os.getpid(), signal.SIGTERM)
+            await wait_for(lambda: plugins.drain.tracker.draining)
+
+            # Still accepting connections: probes fail, new executions are rejected
+            async with client() as probe_client:
+                ready = await probe_client.get(f"{PROBE_PREFIX}/ready")
+            assert ready.status_code == 503
+            assert ready.json()["phase"] == "draining"
+            async with client() as new_client:
+                rejected = await new_client.post("/run")
+            assert rejected.status_code == 503
+            assert rejected.json()["code"] == "SERVER_DRAINING"
+
+            release.set()
+            assert (await in_flight).json() == {"status": "completed"}
+
+        await asyncio.wait_for(server, timeout=10)
+        assert app.shut_down
+        with pytest.raises(httpx.ConnectError):
+            async with client() as closed_client:
+                await closed_client.get(f"{PROBE_PREFIX}/live")
+        assert "Drain interrupted" not in capsys.readouterr().out
+
+
+class TestCreateHttpServer:
+    """Test the enterprise-managed HTTP server."""
+
+    async def test_serves_probes_without_rest_api(self):
+        """Test that probes are mounted on the listener in MCP-only mode."""
+        readiness = ReadinessState()
+        http_server = _create_http_server(FakeApp(), readiness)
+        transport = httpx.ASGITransport(app=http_server.config.app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            assert (await client.get(f"{PROBE_PREFIX}/live")).status_code == 200
+            assert (await client.get(f"{PROBE_PREFIX}/ready")).status_code == 503
+            readiness.mark_ready({})
+            assert (await client.get(f"{PROBE_PREFIX}/ready")).status_code == 200
+            assert (await client.get("/health")).status_code == 200
+
+    async def test_serves_diagnostics_without_rest_api(self):
+        """Test that diagnostics admin endpoints are mounted in MCP-only mode."""
+        http_server = _create_http_server(FakeApp(), ReadinessState(), DiagnosticsPlugin())
+        transport = httpx.ASGITransport(app=http_server.config.app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/v1/enterprise/admin/diagnostics")
+        assert response.status_code == 200
+        assert response.json()["tracemalloc"] is False
@@ -0,0 +1,233 @@
+"""Unit tests for ploston-enterprise memoization detection and step result cache."""
+
+from typing import Any
+
+from ploston_core.invoker import ToolCallResult
+
+from ploston_enterprise.cache import StepResultCache
+from ploston_enterprise.patterns import ExecutionStore, MemoizationAnalyzer, canonical_digest
+from ploston_enterprise.plugins import PatternsPlugin, StepCachePlugin
+
+
+class FakeInvoker:
+    """Tool invoker stub that counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def invoke(
+        self,
+        tool_name: str,
+        params: dict[str, Any],
+        timeout_seconds: int | None = None,
+        step_id: str | None = None,
+        execution_id: str | None = None,
+    ) -> ToolCallResult:
+        self.calls += 1
+        return ToolCallResult(
+            success=True, output={"echo": params}, duration_ms=50, tool_name=tool_name
+        )
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(store: ExecutionStore, tool: str, args: dict, output, ms=100):
+    store.record_tool_call(tool, args, output, ms)
+
+
+class TestMemoizationAnalyzer:
+    """Test memoizable tool detection."""
+
+    def test_detects_deterministic_tool(self):
+        """Test that repeated identical calls with identical output are detected."""
+        store = ExecutionStore()
+        for _ in range(3):
+            _record(store, "geocode", {"city": "Paris"}, {"lat": 48.8})
+        _record(store, "geocode", {"city": "Rome"}, {"lat": 41.9})
+
+        [rec] = MemoizationAnalyzer().analyze(store.tool_calls())
+        assert rec.tool == "geocode"
+        assert rec.observations == 4
+        assert rec.distinct_arguments == 2
+        assert rec.repeated_calls == 2
+        assert rec.hit_ratio == 0.5
+        assert rec.estimated_saving_ms == 200
+
+    def test_argument_order_does_not_matter(self):
+        """Test that arguments are canonicalized."""
+        store = ExecutionStore()
+        _record(store, "lookup", {"a": 1, "b": 2}, "x")
+        _record(store, "lookup", {"b": 2, "a": 1}, "x")
+        _record(store, "lookup", {"a": 1, "b": 2}, "x")
+
+        [rec] = MemoizationAnalyzer().analyze(store.tool_calls())
+        assert rec.distinct_arguments == 1
+
+    def test_rejects_nondeterministic_tool(self):
+        """Test that differing outputs for identical arguments rule a tool out."""
+        store = ExecutionStore()
+        _record(store, "now", {}, "10:00")
+        _record(store, "now", {}, "10:00")
+        _record(store, "now", {}, "10:01")
+
+        assert MemoizationAnalyzer().analyze(store.tool_calls()) == []
+
+    def test_requires_repeated_calls(self):
+        """Test that tools never called twice with the same arguments are skipped."""
+        store = ExecutionStore()
+        for i in range(5):
+            _record(store, "fetch", {"id": i}, i)
+
+        assert MemoizationAnalyzer().analyze(store.tool_calls()) == []
+
+    def test_store_keeps_digests_only(self):
+        """Test that recorded calls do not reference the argument and output objects."""
+        store = ExecutionStore()
+        args = {"city": "Paris"}
+        call = store.record_tool_call("geocode", args, {"lat": 48.8}, 10)
+        args["city"] = "Rome"
+
+        assert not hasattr(call, "args")
+        assert call.args_digest == canonical_digest({"city": "Paris"})
+        assert call.output_digest == canonical_digest({"lat": 48.8})
+
+
+class TestStepResultCache:
+    """Test the step result cache."""
+
+    def test_hit_returns_copy(self):
+        """Test that cached values cannot be mutated by callers."""
+        cache = StepResultCache()
+        cache.put("tool", {"a": 1}, {"items": [1]})
+
+        entry = cache.get("tool", {"a": 1})
+        entry.value["items"].append(2)
+
+        assert cache.get("tool", {"a": 1}).value == {"items": [1]}
+        assert cache.stats()["hits"] == 2
+
+    def test_miss_on_different_args(self):
+        """Test that different arguments miss."""
+        cache = StepResultCache()
+        cache.put("tool", {"a": 1}, "x")
+        assert cache.get("tool", {"a": 2}) is None
+        assert cache.get("other", {"a": 1}) is None
+        assert cache.stats()["misses"] == 2
+
+    def test_caches_none_results(self):
+        """Test that None is a cacheable result."""
+        cache = StepResultCache()
+        cache.put("tool", {}, None)
+        entry = cache.get("tool", {})
+        assert entry is not None
+        assert entry.value is None
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the TTL."""
+        clock = FakeClock()
+        cache = StepResultCache(ttl_seconds=10, clock=clock)
+        cache.put("tool", {}, "x")
+
+        clock.now = 9.9
+        assert cache.get("tool", {}) is not None
+        clock.now = 10.0
+        assert cache.get("tool", {}) is None
+        assert cache.stats()["expirations"] == 1
+        assert cache.stats()["bytes"] == 0
+
+    def test_lru_eviction_by_count(self):
+        """Test that the least recently used entry is evicted."""
+        cache = StepResultCache(max_entries=2)
+        cache.put("tool", {"n": 1}, 1)
+        cache.put("tool", {"n": 2}, 2)
+        cache.get("tool", {"n": 1})
+        cache.put("tool", {"n": 3}, 3)
+
+        assert cache.get("tool", {"n": 2}) is None
+        assert cache.get("tool", {"n": 1}) is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_size(self):
+        """Test that total size stays within max_bytes."""
+        cache = StepResultCache(max_bytes=20)
+        cache.put("tool", {"n": 1}, "a" * 10)
+        cache.put("tool", {"n": 2}, "b" * 10)
+
+        assert len(cache) == 1
+        assert cache.stats()["bytes"] == 12
+        assert cache.put("tool", {"n": 3}, "c" * 100) is False
+
+    def test_invalidate_tool(self):
+        """Test that invalidation can target a single tool."""
+        cache = StepResultCache()
+        cache.put("a", {}, 1)
+        cache.put("b", {}, 2)
+
+        assert cache.invalidate("a") == 1
+        assert cache.get("a", {}) is None
+        assert cache.get("b", {}) is not None
+
+
+class TestStepCachePlugin:
+    """Test tool call caching through the invoker."""
+
+    async def test_serves_repeated_calls_from_cache(self):
+        """Test that identical calls to a cacheable tool hit the cache."""
+        invoker = FakeInvoker()
+        plugin = StepCachePlugin(tools=["geocode"])
+        plugin.attach(invoker)
+
+        first = await invoker.invoke("geocode", {"city": "Paris"})
+        second = await invoker.invoke("geocode", {"city": "Paris"})
+
+        assert invoker.calls == 1
+        assert second.output == first.output
+        assert second.duration_ms == 0
+
+    async def test_other_tools_are_not_cached(self):
+        """Test that tools outside the cacheable set always execute."""
+        invoker = FakeInvoker()
+        plugin = StepCachePlugin(tools=["geocode"])
+        plugin.attach(invoker)
+
+        await invoker.invoke("send_email", {"to": "a"})
+        await invoker.invoke("send_email", {"to": "a"})
+
+        assert invoker.calls == 2
+
+    async def test_detected_tools_are_not_cached(self):
+        """Test that memoization recommendations are not applied automatically."""
+        invoker = FakeInvoker()
+        patterns = PatternsPlugin()
+        patterns.observe_tool_calls(invoker)
+        plugin = StepCachePlugin()
+        plugin.attach(invoker)
+
+        for _ in range(4):
+            await invoker.invoke("slack_post", {"text": "hi"})
+
+        assert [r.tool for r in patterns.get_memoization_recommendations()] == ["slack_post"]
+        assert plugin.cacheable_tools == set()
+        assert invoker.calls == 4
+
+    async def test_never_caches_code_steps(self):
+        """Test that python_exec is neither recommended nor cached."""
+        invoker = FakeInvoker()
+        patterns = PatternsPlugin()
+        patterns.observe_tool_calls(invoker)
+        plugin = StepCachePlugin(tools=["python_exec"])
+        plugin.attach(invoker)
+
+        for _ in range(4):
+            await invoker.invoke("python_exec", {"code": "return 1"})
+
+        assert patterns.get_memoization_recommendations() == []
+        assert invoker.calls == 4
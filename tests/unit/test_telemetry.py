@@ -0,0 +1,187 @@
+"""Unit tests for ploston-enterprise tiered telemetry retention."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from ploston_enterprise.plugins import TelemetryPlugin
+from ploston_enterprise.telemetry import (
+    ExecutionSample,
+    QuantileSketch,
+    Resolution,
+    RetentionPolicy,
+    TieredTelemetryStore,
+)
+
+T0 = datetime(2026, 3, 1, tzinfo=UTC)
+
+
+def _sample(at: datetime, duration_ms: float = 100.0, success: bool = True, wf: str = "wf"):
+    return ExecutionSample(workflow_id=wf, finished_at=at, duration_ms=duration_ms, success=success)
+
+
+class TestQuantileSketch:
+    """Test the quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test that estimates stay within the configured relative error."""
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(4, 1) for _ in range(5000))
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.99):
+            expected = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.011)
+
+    def test_merge_matches_single_sketch(self):
+        """Test that merged sketches equal one sketch over all values."""
+        a, b, combined = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i in range(1, 200):
+            (a if i % 2 else b).add(i)
+            combined.add(i)
+        a.merge(b)
+        assert a.count == combined.count
+        assert a.quantile(0.95) == combined.quantile(0.95)
+
+    def test_round_trip_and_bounded_size(self):
+        """Test serialization and that collapsing caps the bucket count."""
+        sketch = QuantileSketch(max_buckets=50)
+        for i in range(1, 10_000):
+            sketch.add(i)
+        data = sketch.to_dict()
+        assert len(data["buckets"]) == 50
+
+        restored = QuantileSketch.from_dict(data)
+        assert restored.count == sketch.count
+        assert restored.quantile(0.99) == sketch.quantile(0.99)
+
+
+class TestTieredTelemetryStore:
+    """Test rollup and retention of telemetry tiers."""
+
+    @pytest.fixture
+    async def store(self):
+        store = TieredTelemetryStore(policy=RetentionPolicy(raw_days=2, hourly_days=5))
+        yield store
+        await store.close()
+
+    async def test_rolls_up_closed_hours_and_days(self, store):
+        """Test that raw records become hourly and daily rollups."""
+        await store.record(_sample(T0 + timedelta(minutes=5), 100))
+        await store.record(_sample(T0 + timedelta(minutes=50), 300, success=False))
+        await store.record(_sample(T0 + timedelta(hours=1, minutes=5), 200))
+        # Current hour stays raw
+        now = T0 + timedelta(hours=2, minutes=30)
+        await store.record(_sample(now - timedelta(minutes=10), 400))
+
+        summary = await store.compact(now)
+        assert summary["raw_rolled_up"] == 3
+
+        hourly = await store.query(Resolution.HOURLY, workflow_id="wf")
+        assert [(r.bucket_start, r.count, r.errors) for r in hourly] == [
+            (T0, 2, 1),
+            (T0 + timedelta(hours=1), 1, 0),
+        ]
+        assert hourly[0].error_rate == 0.5
+        assert await store.query(Resolution.DAILY) == []
+
+        await store.compact(T0 + timedelta(days=1, minutes=1))
+        [daily] = await store.query(Resolution.DAILY)
+        assert daily.bucket_start == T0
+        assert daily.count == 4
+        assert daily.errors == 1
+        assert daily.to_dict()["p50_ms"] == pytest.approx(200, rel=0.02)
+
+    async def test_compaction_is_idempotent(self, store):
+        """Test that repeated compaction does not double count."""
+        await store.record(_sample(T0))
+        now = T0 + timedelta(days=1, hours=1)
+        await store.compact(now)
+        await store.compact(now)
+        [daily] = await store.query(Resolution.DAILY)
+        assert daily.count == 1
+
+    async def test_late_records_reach_rolled_up_days(self, store):
+        """Test that records for an already rolled-up day are still counted."""
+        await store.record(_sample(T0))
+        now = T0 + timedelta(days=1, hours=1)
+        await store.compact(now)
+
+        await store.record(_sample(T0 + timedelta(minutes=30)))
+        await store.compact(now)
+        [daily] = await store.query(Resolution.DAILY)
+        assert daily.count == 2
+
+    async def test_expires_each_tier(self, store):
+        """Test that storage is bounded by the retention policy."""
+        for day in range(10):
+            await store.record(_sample(T0 + timedelta(days=day)))
+        await store.compact(T0 + timedelta(days=10))
+
+        stats = await store.stats()
+        # Raw: last 2 days; hourly: last 5 days; daily: all 10 days
+        assert stats["raw_records"] == 2
+        assert stats["hourly_rollups"] == 5
+        assert stats["daily_rollups"] == 10
+
+        await store.compact(T0 + timedelta(days=400))
+        stats = await store.stats()
+        assert (stats["raw_records"], stats["hourly_rollups"], stats["daily_rollups"]) == (
+            0,
+            0,
+            0,
+        )
+
+    async def test_compaction_shrinks_database(self, tmp_path):
+        """Test that space freed by expired rows is returned to the file system."""
+        store = TieredTelemetryStore(db_path=str(tmp_path / "telemetry.db"))
+        try:
+            for i in range(2000):
+                await store.record(_sample(T0 + timedelta(seconds=i)))
+            before = await store.stats()
+
+            await store.compact(T0 + timedelta(days=400))
+            after = await store.stats()
+        finally:
+            await store.close()
+
+        assert after["raw_records"] == 0
+        assert after["size_bytes"] < before["size_bytes"] / 2
+
+    async def test_query_filters(self, store):
+        """Test filtering rollups by workflow and time range."""
+        for day in range(3):
+            await store.record(_sample(T0 + timedelta(days=day), wf="a"))
+            await store.record(_sample(T0 + timedelta(days=day), wf="b"))
+        await store.compact(T0 + timedelta(days=3))
+
+        rollups = await store.query(
+            Resolution.DAILY,
+            workflow_id="a",
+            since=T0 + timedelta(days=1),
+            until=T0 + timedelta(days=2),
+        )
+        assert [(r.workflow_id, r.bucket_start) for r in rollups] == [("a", T0 + timedelta(days=1))]
+
+
+class TestTelemetryPlugin:
+    """Test recording of execution outcomes."""
+
+    async def test_records_completed_and_failed_executions(self):
+        """Test that every execution produces one raw record."""
+        plugin = TelemetryPlugin()
+        context = {"invocation_id": "1"}
+        await plugin.on_workflow_start("wf", context)
+        await plugin.on_workflow_complete("wf", {"status": "completed", "duration_ms": 50}, context)
+        context = {"invocation_id": "2"}
+        await plugin.on_workflow_start("wf", context)
+        await plugin.on_workflow_error("wf", RuntimeError("boom"), context)
+
+        await plugin.store.compact(datetime.now(UTC) + timedelta(hours=1))
+        [rollup] = await plugin.store.query(Resolution.HOURLY)
+        assert rollup.count == 2
+        assert rollup.errors == 1
+        await plugin.on_shutdown()